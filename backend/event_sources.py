@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
+from functools import lru_cache
 from typing import Any
 
 import gspread
@@ -14,6 +17,16 @@ from google.oauth2.service_account import Credentials
 
 GOOGLE_SERVICE_ACCOUNT = os.getenv("GOOGLE_SERVICE_ACCOUNT", "").strip()
 SPREADSHEET_ID = os.getenv("SPREADSHEET_ID", "").strip()
+_SHEET_CACHE_TTL_SECONDS = int(os.getenv("SHEET_TTL_SECONDS", "60"))
+
+_sheet_cache_lock = threading.Lock()
+_sheet_fetch_lock = threading.Lock()
+# (cabecalhos, linhas) exatamente como o get_all_values devolve.
+SheetValues = tuple[list[str], list[list[str]]]
+
+_sheet_cache: tuple[float, SheetValues | None] = (0.0, None)
+# Incrementado a cada invalidacao: um download iniciado antes de uma escrita nao volta ao cache.
+_sheet_generation = 0
 
 
 def _excerpt_error(exc: Exception, limit: int = 300) -> str:
@@ -30,23 +43,28 @@ def _load_service_account_info() -> dict[str, Any]:
         raise HTTPException(status_code=500, detail="GOOGLE_SERVICE_ACCOUNT contem JSON invalido") from exc
 
 
-_READ_SCOPES = [
+_READ_SCOPES = (
     "https://www.googleapis.com/auth/spreadsheets.readonly",
     "https://www.googleapis.com/auth/drive.readonly",
-]
-_WRITE_SCOPES = [
+)
+_WRITE_SCOPES = (
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
-]
+)
+
 
+@lru_cache(maxsize=None)
+def _get_gspread_client(scopes: tuple[str, ...]) -> gspread.Client:
+    """Cliente gspread por conjunto de escopos, reaproveitado entre chamadas (mantem a conexao HTTP)."""
+    credentials = Credentials.from_service_account_info(_load_service_account_info(), scopes=list(scopes))
+    return gspread.authorize(credentials)
 
-def _open_worksheet(scopes: list[str]) -> gspread.Worksheet:
+
+def _open_worksheet(scopes: tuple[str, ...]) -> gspread.Worksheet:
     if not SPREADSHEET_ID:
         raise HTTPException(status_code=500, detail="Variavel SPREADSHEET_ID nao configurada")
-    service_account_info = _load_service_account_info()
     try:
-        credentials = Credentials.from_service_account_info(service_account_info, scopes=scopes)
-        client = gspread.authorize(credentials)
+        client = _get_gspread_client(scopes)
         worksheet = client.open_by_key(SPREADSHEET_ID).get_worksheet(0)
         if worksheet is None:
             raise HTTPException(status_code=500, detail="A planilha nao possui abas")
@@ -57,8 +75,47 @@ def _open_worksheet(scopes: list[str]) -> gspread.Worksheet:
         raise HTTPException(status_code=502, detail="Falha ao conectar ao Google Sheets") from exc
 
 
-def load_google_sheet() -> pd.DataFrame:
-    """Carrega a primeira aba da planilha via Service Account."""
+def invalidate_sheet_cache() -> None:
+    """Descarta o cache da planilha do calendario; a proxima leitura vai ao Google Sheets."""
+    global _sheet_cache, _sheet_generation
+    with _sheet_cache_lock:
+        _sheet_cache = (0.0, None)
+        _sheet_generation += 1
+
+
+def load_google_sheet() -> SheetValues:
+    """Carrega a primeira aba da planilha como (cabecalhos, linhas), com cache em memoria.
+
+    As linhas devolvidas sao compartilhadas entre chamadas; quem precisar altera-las deve copiar.
+    """
+    global _sheet_cache
+    cached = _get_cached_sheet()
+    if cached is not None:
+        return cached
+
+    # Um unico download por expiracao: quem chegar depois espera e reaproveita o resultado.
+    with _sheet_fetch_lock:
+        cached = _get_cached_sheet()
+        if cached is not None:
+            return cached
+        with _sheet_cache_lock:
+            generation = _sheet_generation
+        sheet = _fetch_google_sheet()
+        with _sheet_cache_lock:
+            if generation == _sheet_generation:
+                _sheet_cache = (time.monotonic(), sheet)
+    return sheet
+
+
+def _get_cached_sheet() -> SheetValues | None:
+    with _sheet_cache_lock:
+        cached_at, cached = _sheet_cache
+    if cached is not None and time.monotonic() - cached_at < _SHEET_CACHE_TTL_SECONDS:
+        return cached
+    return None
+
+
+def _fetch_google_sheet() -> SheetValues:
     try:
         worksheet = _open_worksheet(_READ_SCOPES)
         values = worksheet.get_all_values()
@@ -71,19 +128,16 @@ def load_google_sheet() -> pd.DataFrame:
         ) from exc
 
     if not values:
-        return pd.DataFrame()
+        return [], []
 
-    headers = values[0]
-    rows = values[1:]
-    return pd.DataFrame(rows, columns=headers).fillna("")
+    # get_all_values ja completa as linhas com "" ate a largura do cabecalho.
+    return values[0], values[1:]
 
 
 def load_google_sheet_by_name(spreadsheet_name: str, worksheet_title: str | None = None) -> pd.DataFrame:
     """Carrega uma planilha compartilhada com a Service Account pelo nome do arquivo."""
-    service_account_info = _load_service_account_info()
     try:
-        credentials = Credentials.from_service_account_info(service_account_info, scopes=_READ_SCOPES)
-        client = gspread.authorize(credentials)
+        client = _get_gspread_client(_READ_SCOPES)
         spreadsheet = client.open(spreadsheet_name)
         worksheet = spreadsheet.worksheet(worksheet_title) if worksheet_title else spreadsheet.get_worksheet(0)
         if worksheet is None:
@@ -108,11 +162,21 @@ def get_sheet_headers() -> list[str]:
     return worksheet.row_values(1)
 
 
+def get_calendar_row(row_index: int) -> list[str]:
+    """Le uma linha direto da planilha (sem cache) pelo índice (1-based)."""
+    worksheet = _open_worksheet(_WRITE_SCOPES)
+    try:
+        return worksheet.row_values(row_index)
+    except Exception as exc:
+        raise HTTPException(status_code=502, detail=f"Falha ao ler linha: {exc}") from exc
+
+
 def append_calendar_row(row_data: list[str]) -> int:
     """Adiciona uma linha ao final da planilha. Retorna o índice da linha (1-based)."""
     worksheet = _open_worksheet(_WRITE_SCOPES)
     try:
         result = worksheet.append_row(row_data, value_input_option="USER_ENTERED")
+        invalidate_sheet_cache()
         updated_range = result.get("updates", {}).get("updatedRange", "")
         # "Sheet1!A5:G5" -> extract row number
         part = updated_range.split("!")[1] if "!" in updated_range else ""
@@ -135,6 +199,7 @@ def update_calendar_row(row_index: int, row_data: list[str]) -> None:
             [row_data],
             value_input_option="USER_ENTERED",
         )
+        invalidate_sheet_cache()
     except HTTPException:
         raise
     except Exception as exc:
@@ -146,6 +211,7 @@ def delete_calendar_row(row_index: int) -> None:
     worksheet = _open_worksheet(_WRITE_SCOPES)
     try:
         worksheet.delete_rows(row_index)
+        invalidate_sheet_cache()
     except HTTPException:
         raise
     except Exception as exc:
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import calendar
+import copy
+import inspect
 import json
 import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
 from datetime import date, timedelta
-from typing import Any
+from functools import lru_cache, wraps
+from typing import Any, NamedTuple, TypeVar
 
+import grpc
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Filter,
@@ -21,8 +30,9 @@ from google.analytics.data_v1beta.types import (
 from google.oauth2.service_account import Credentials
 
 GOOGLE_SERVICE_ACCOUNT = os.getenv("GOOGLE_SERVICE_ACCOUNT", "").strip()
-CRM_REGEX = r"(?i).*(email|crm|sms|whatsapp|push).*"
+CRM_SOURCE_MEDIUM_TOKENS = ("email", "crm", "sms", "whatsapp", "push")
 GA4_TIMEOUT_SECONDS = 30
+GA4_PAGE_SIZE = 100_000
 ABANDONED_CART_COUPONS = [
     "CARRINHO-100",
     "CARRINHO-50",
@@ -30,8 +40,21 @@ ABANDONED_CART_COUPONS = [
     "CARRINHO-15",
 ]
 ABANDONED_CART_CRM_SCOPES = {"all", "only_crm", "non_crm"}
+GA4_CACHE_TTL_SECONDS = 300
+GA4_CLOSED_PERIOD_CACHE_TTL_SECONDS = 24 * 60 * 60
+# O GA4 ainda reprocessa as ultimas 24-48 h; so periodos encerrados ha mais tempo sao finais.
+GA4_PROCESSING_LAG_DAYS = 2
+GA4_CACHE_MAX_ENTRIES = 512
 
+_GA4_SCOPES = ("https://www.googleapis.com/auth/analytics.readonly",)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+_report_cache_lock = threading.Lock()
+_report_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+_report_inflight: dict[tuple[str, str], Future[Any]] = {}
+
+
+@lru_cache(maxsize=1)
 def _load_service_account_info() -> dict[str, Any]:
     if not GOOGLE_SERVICE_ACCOUNT:
         raise RuntimeError("Variavel GOOGLE_SERVICE_ACCOUNT nao configurada")
@@ -42,13 +65,111 @@ def _load_service_account_info() -> dict[str, Any]:
         raise RuntimeError("GOOGLE_SERVICE_ACCOUNT contem JSON invalido") from exc
 
 
+@lru_cache(maxsize=1)
 def _get_ga4_client() -> BetaAnalyticsDataClient:
+    # O cliente gRPC e thread-safe; um por processo evita refazer credenciais e canal a cada consulta.
     service_account_info = _load_service_account_info()
-    scopes = ["https://www.googleapis.com/auth/analytics.readonly"]
-    credentials = Credentials.from_service_account_info(service_account_info, scopes=scopes)
+    credentials = Credentials.from_service_account_info(service_account_info, scopes=_GA4_SCOPES)
     return BetaAnalyticsDataClient(credentials=credentials)
 
 
+def warmup_ga4_client() -> None:
+    """Cria o cliente GA4 e abre o canal gRPC antes da primeira consulta.
+
+    Pensado para rodar em segundo plano na subida do servidor; sem credenciais ou rede,
+    nao faz nada e a primeira consulta tenta de novo normalmente.
+    """
+    try:
+        client = _get_ga4_client()
+        grpc.channel_ready_future(client.transport.grpc_channel).result(timeout=GA4_TIMEOUT_SECONDS)
+    except Exception:
+        return
+
+
+def _cached_report(period_end: Callable[[dict[str, Any]], str | None] | None = None) -> Callable[[_F], _F]:
+    """Guarda o resultado de uma consulta GA4 em memoria por alguns minutos.
+
+    Quando period_end indica que o periodo consultado terminou antes da janela de
+    reprocessamento do GA4, os dados nao mudam mais e o resultado vale por um dia.
+    Cada chamada recebe uma copia, nunca o objeto em cache.
+    """
+
+    def decorator(func: _F) -> _F:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs).arguments
+            key = (func.__qualname__, repr(sorted(arguments.items())))
+            now = time.monotonic()
+            with _report_cache_lock:
+                entry = _report_cache.get(key)
+                if entry is not None and entry[0] > now:
+                    return copy.deepcopy(entry[1])
+                # Single-flight: chamadas identicas simultaneas esperam a consulta ja em andamento.
+                pending = _report_inflight.get(key)
+                if pending is None:
+                    pending = _report_inflight[key] = Future()
+                    is_leader = True
+                else:
+                    is_leader = False
+
+            if not is_leader:
+                return copy.deepcopy(pending.result())
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                pending.set_exception(exc)
+                with _report_cache_lock:
+                    _report_inflight.pop(key, None)
+                raise
+
+            ttl = GA4_CACHE_TTL_SECONDS
+            if period_end is not None:
+                try:
+                    end = period_end(arguments)
+                    if end and date.fromisoformat(end) <= date.today() - timedelta(days=GA4_PROCESSING_LAG_DAYS):
+                        ttl = GA4_CLOSED_PERIOD_CACHE_TTL_SECONDS
+                except (TypeError, ValueError):
+                    pass
+
+            now = time.monotonic()
+            with _report_cache_lock:
+                if len(_report_cache) >= GA4_CACHE_MAX_ENTRIES:
+                    for stale_key in [k for k, (expires, _) in _report_cache.items() if expires <= now]:
+                        del _report_cache[stale_key]
+                    while len(_report_cache) >= GA4_CACHE_MAX_ENTRIES:
+                        del _report_cache[next(iter(_report_cache))]
+                _report_cache[key] = (now + ttl, result)
+                _report_inflight.pop(key, None)
+            pending.set_result(result)
+            return copy.deepcopy(result)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _month_end_argument(arguments: dict[str, Any]) -> str | None:
+    year, month = arguments.get("year"), arguments.get("month")
+    if year is None or month is None:
+        return None
+    return _month_date_range(year, month)[1]
+
+
+def _end_date_argument(arguments: dict[str, Any]) -> str | None:
+    return arguments.get("end_date")
+
+
+# Requests fixos: cada chamada copia o template (uma copia do proto) e so troca property/datas.
+_SESSIONS_YESTERDAY_TEMPLATE = RunReportRequest(
+    date_ranges=[DateRange(start_date="yesterday", end_date="yesterday")],
+    metrics=[Metric(name="sessions"), Metric(name="totalUsers")],
+)
+
+
+@_cached_report()
 def get_sessions_yesterday(property_id: str) -> dict[str, int]:
     """Retorna sessoes e usuarios de ontem para uma propriedade GA4."""
     if not property_id or not str(property_id).strip():
@@ -63,11 +184,8 @@ def get_sessions_yesterday(property_id: str) -> dict[str, int]:
     client = _get_ga4_client()
 
     try:
-        request = RunReportRequest(
-            property=property_resource,
-            date_ranges=[DateRange(start_date="yesterday", end_date="yesterday")],
-            metrics=[Metric(name="sessions"), Metric(name="totalUsers")],
-        )
+        request = RunReportRequest(_SESSIONS_YESTERDAY_TEMPLATE)
+        request.property = property_resource
         response = client.run_report(request=request, timeout=GA4_TIMEOUT_SECONDS)
     except Exception as exc:
         error_type = exc.__class__.__name__
@@ -94,6 +212,7 @@ def _resolve_property_resource(property_id: str) -> str:
     return f"properties/{ga_property}"
 
 
+@lru_cache(maxsize=128)
 def _month_date_range(target_year: int, target_month: int) -> tuple[str, str]:
     last_day = calendar.monthrange(target_year, target_month)[1]
     start_date = date(target_year, target_month, 1).isoformat()
@@ -114,35 +233,47 @@ def _normalize_period_to_today(start_date: str, end_date: str) -> tuple[str, str
     return start.isoformat(), end.isoformat()
 
 
-def _build_crm_filter() -> FilterExpression:
+def _build_crm_source_medium_filter(field_name: str) -> FilterExpression:
+    """OR de CONTAINS (sem diferenciar caixa) para cada termo de CRM; evita regex no servidor."""
     return FilterExpression(
-        filter=Filter(
-            field_name="sessionSourceMedium",
-            string_filter=Filter.StringFilter(
-                match_type=Filter.StringFilter.MatchType.FULL_REGEXP,
-                value=CRM_REGEX,
-            ),
+        or_group=FilterExpressionList(
+            expressions=[
+                FilterExpression(
+                    filter=Filter(
+                        field_name=field_name,
+                        string_filter=Filter.StringFilter(
+                            match_type=Filter.StringFilter.MatchType.CONTAINS,
+                            value=token,
+                            case_sensitive=False,
+                        ),
+                    )
+                )
+                for token in CRM_SOURCE_MEDIUM_TOKENS
+            ]
         )
     )
 
 
-def _build_first_user_crm_filter() -> FilterExpression:
-    return FilterExpression(
-        filter=Filter(
-            field_name="firstUserSourceMedium",
-            string_filter=Filter.StringFilter(
-                match_type=Filter.StringFilter.MatchType.FULL_REGEXP,
-                value=CRM_REGEX,
-            ),
-        )
+# Filtros fixos: montados uma vez e copiados pelo proto-plus ao serem usados em cada request.
+_CRM_FILTER = _build_crm_source_medium_filter("sessionSourceMedium")
+_FIRST_USER_CRM_FILTER = _build_crm_source_medium_filter("firstUserSourceMedium")
+_NON_CRM_FILTER = FilterExpression(not_expression=_CRM_FILTER)
+_PURCHASE_EVENT_FILTER = FilterExpression(
+    filter=Filter(
+        field_name="eventName",
+        string_filter=Filter.StringFilter(
+            match_type=Filter.StringFilter.MatchType.EXACT,
+            value="purchase",
+        ),
     )
+)
+# Primeira visita via CRM, sessao atual fora do CRM (proxy de assistencia).
+_ASSISTED_CRM_FILTER = FilterExpression(
+    and_group=FilterExpressionList(expressions=[_FIRST_USER_CRM_FILTER, _NON_CRM_FILTER])
+)
 
 
-def _build_non_crm_filter() -> FilterExpression:
-    return FilterExpression(not_expression=_build_crm_filter())
-
-
-def _build_in_list_filter(field_name: str, values: list[str]) -> FilterExpression:
+def _build_in_list_filter(field_name: str, values: Sequence[str]) -> FilterExpression:
     return FilterExpression(
         filter=Filter(
             field_name=field_name,
@@ -151,13 +282,15 @@ def _build_in_list_filter(field_name: str, values: list[str]) -> FilterExpressio
     )
 
 
-def _date_list_yyyymmdd(start_date: str, end_date: str) -> list[str]:
+@lru_cache(maxsize=128)
+def _date_list_yyyymmdd(start_date: str, end_date: str) -> tuple[str, ...]:
     start = date.fromisoformat(start_date)
     end = date.fromisoformat(end_date)
-    days = (end - start).days
-    if days < 0:
+    if end < start:
         raise RuntimeError("Periodo invalido: start deve ser menor ou igual a end")
-    return [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(days + 1)]
+    # firstSessionDate e uma dimensao texto (YYYYMMDD); sem between_filter, a lista e necessaria.
+    days = [date.fromordinal(ordinal) for ordinal in range(start.toordinal(), end.toordinal() + 1)]
+    return tuple(f"{day.year:04d}{day.month:02d}{day.day:02d}" for day in days)
 
 
 def _run_report(request: RunReportRequest, client: BetaAnalyticsDataClient):
@@ -168,23 +301,72 @@ def _run_report(request: RunReportRequest, client: BetaAnalyticsDataClient):
         raise RuntimeError(f"Falha ao consultar Google Analytics Data API [{error_type}]: {exc}") from exc
 
 
-def _run_crm_report(
-    client: BetaAnalyticsDataClient, property_resource: str, start_date: str, end_date: str
-) -> dict[str, int | float]:
-    request = RunReportRequest(
-        property=property_resource,
-        dimensions=[Dimension(name="sessionSourceMedium")],
-        metrics=[
-            Metric(name="sessions"),
-            Metric(name="totalUsers"),
-            Metric(name="transactions"),
-            Metric(name="purchaseRevenue"),
-        ],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-        dimension_filter=_build_crm_filter(),
-    )
-    response = _run_report(request, client)
+def _iter_report_rows(request: RunReportRequest, client: BetaAnalyticsDataClient) -> Iterator[Any]:
+    """Percorre todas as linhas de um relatorio dimensionado, pagina a pagina.
+
+    Sem limit explicito o GA4 corta em 10.000 linhas; aqui cada pagina vem com GA4_PAGE_SIZE
+    linhas e a proxima e pedida enquanto row_count indicar que ainda ha dados.
+    """
+    request.limit = GA4_PAGE_SIZE
+    offset = 0
+    while True:
+        request.offset = offset
+        response = _run_report(request, client)
+        yield from response.rows
+        offset += len(response.rows)
+        if not response.rows or offset >= response.row_count:
+            return
+
+
+def _run_batch_reports(
+    property_resource: str, requests: list[RunReportRequest], client: BetaAnalyticsDataClient
+) -> list[Any]:
+    """Executa ate 5 relatorios em uma unica chamada; devolve as respostas na mesma ordem."""
+    try:
+        response = client.batch_run_reports(
+            request=BatchRunReportsRequest(property=property_resource, requests=requests),
+            timeout=GA4_TIMEOUT_SECONDS,
+        )
+    except Exception as exc:
+        error_type = exc.__class__.__name__
+        raise RuntimeError(f"Falha ao consultar Google Analytics Data API [{error_type}]: {exc}") from exc
+    return list(response.reports)
+
+
+_CRM_REPORT_TEMPLATE = RunReportRequest(
+    metrics=[
+        Metric(name="sessions"),
+        Metric(name="totalUsers"),
+        Metric(name="transactions"),
+        Metric(name="purchaseRevenue"),
+    ],
+    dimension_filter=_CRM_FILTER,
+)
+
+
+def _build_crm_report_request(property_resource: str, start_date: str, end_date: str) -> RunReportRequest:
+    request = RunReportRequest(_CRM_REPORT_TEMPLATE)
+    request.property = property_resource
+    request.date_ranges.append(DateRange(start_date=start_date, end_date=end_date))
+    return request
+
 
+_CRM_TOTALS_KEYS = ("sessions", "totalUsers", "transactions", "purchaseRevenue")
+
+
+class CrmTotals(NamedTuple):
+    """Totais CRM de um periodo, na ordem das metricas de _build_crm_report_request."""
+
+    sessions: int = 0
+    total_users: int = 0
+    transactions: int = 0
+    purchase_revenue: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return dict(zip(_CRM_TOTALS_KEYS, self))
+
+
+def _parse_crm_report(response: Any) -> CrmTotals:
     sessions = 0
     users = 0
     transactions = 0
@@ -198,12 +380,14 @@ def _run_crm_report(
             transactions += int(metric_values[2].value or 0)
             purchase_revenue += float(metric_values[3].value or 0.0)
 
-    return {
-        "sessions": sessions,
-        "totalUsers": users,
-        "transactions": transactions,
-        "purchaseRevenue": purchase_revenue,
-    }
+    return CrmTotals(sessions, users, transactions, purchase_revenue)
+
+
+def _run_crm_report(
+    client: BetaAnalyticsDataClient, property_resource: str, start_date: str, end_date: str
+) -> CrmTotals:
+    request = _build_crm_report_request(property_resource, start_date, end_date)
+    return _parse_crm_report(_run_report(request, client))
 
 
 def _percentage_variation(current: int | float, previous: int | float) -> float | None:
@@ -214,6 +398,7 @@ def _percentage_variation(current: int | float, previous: int | float) -> float
     return round(((current - previous) / previous) * 100, 2)
 
 
+@_cached_report(_month_end_argument)
 def get_crm_monthly_report(property_id: str, year: int, month: int) -> dict[str, Any]:
     """Compara CRM do mes atual vs mesmo mes do ano anterior."""
     if month < 1 or month > 12:
@@ -230,18 +415,7 @@ def get_crm_monthly_report(property_id: str, year: int, month: int) -> dict[str,
 
     normalized_current = _normalize_period_to_today(current_start, current_end)
     if normalized_current is None:
-        current_year = {
-            "sessions": 0,
-            "totalUsers": 0,
-            "transactions": 0,
-            "purchaseRevenue": 0.0,
-        }
-        last_year = {
-            "sessions": 0,
-            "totalUsers": 0,
-            "transactions": 0,
-            "purchaseRevenue": 0.0,
-        }
+        current_year = last_year = CrmTotals()
     else:
         current_start, current_end = normalized_current
 
@@ -250,30 +424,35 @@ def get_crm_monthly_report(property_id: str, year: int, month: int) -> dict[str,
             previous_last_day = calendar.monthrange(year - 1, month)[1]
             previous_end = date(year - 1, month, min(today.day, previous_last_day)).isoformat()
 
-        current_year = _run_crm_report(client, property_resource, current_start, current_end)
-        last_year = _run_crm_report(client, property_resource, previous_start, previous_end)
+        current_response, previous_response = _run_batch_reports(
+            property_resource,
+            [
+                _build_crm_report_request(property_resource, current_start, current_end),
+                _build_crm_report_request(property_resource, previous_start, previous_end),
+            ],
+            client,
+        )
+        current_year = _parse_crm_report(current_response)
+        last_year = _parse_crm_report(previous_response)
 
     variation = {
-        "sessions": _percentage_variation(current_year["sessions"], last_year["sessions"]),
-        "totalUsers": _percentage_variation(current_year["totalUsers"], last_year["totalUsers"]),
-        "transactions": _percentage_variation(current_year["transactions"], last_year["transactions"]),
-        "purchaseRevenue": _percentage_variation(current_year["purchaseRevenue"], last_year["purchaseRevenue"]),
+        key: _percentage_variation(current, previous)
+        for key, current, previous in zip(_CRM_TOTALS_KEYS, current_year, last_year)
     }
 
     return {
-        "current_year": current_year,
-        "last_year": last_year,
+        "current_year": current_year.as_dict(),
+        "last_year": last_year.as_dict(),
         "variation": variation,
     }
 
 
+@_cached_report(_end_date_argument)
 def get_crm_range_report(property_id: str, start_date: str, end_date: str) -> dict[str, Any]:
     """Retorna métricas CRM GA4 para um intervalo de datas livre (YYYY-MM-DD)."""
     property_resource = _resolve_property_resource(property_id)
     client = _get_ga4_client()
-    result = _run_crm_report(client, property_resource, start_date, end_date)
-    return {"purchaseRevenue": result["purchaseRevenue"], "sessions": result["sessions"],
-            "totalUsers": result["totalUsers"], "transactions": result["transactions"]}
+    return _run_crm_report(client, property_resource, start_date, end_date).as_dict()
 
 
 def _validate_iso_date(date_text: str) -> str:
@@ -283,6 +462,7 @@ def _validate_iso_date(date_text: str) -> str:
         raise RuntimeError("Data invalida. Use o formato YYYY-MM-DD") from exc
 
 
+@_cached_report(_end_date_argument)
 def get_crm_assisted_conversions(property_id: str, start_date: str, end_date: str) -> dict[str, int | float]:
     """
     Estima conversoes assistidas por CRM.
@@ -306,14 +486,9 @@ def get_crm_assisted_conversions(property_id: str, start_date: str, end_date: st
     property_resource = _resolve_property_resource(property_id)
     client = _get_ga4_client()
 
-    # Consulta principal de CRM com dimensoes solicitadas.
+    # Consulta principal de CRM (totais do periodo).
     crm_request = RunReportRequest(
         property=property_resource,
-        dimensions=[
-            Dimension(name="sessionSourceMedium"),
-            Dimension(name="date"),
-            Dimension(name="sessionCampaignName"),
-        ],
         metrics=[
             Metric(name="sessions"),
             Metric(name="totalUsers"),
@@ -321,36 +496,28 @@ def get_crm_assisted_conversions(property_id: str, start_date: str, end_date: st
             Metric(name="purchaseRevenue"),
         ],
         date_ranges=[DateRange(start_date=start, end_date=end)],
-        dimension_filter=_build_crm_filter(),
+        dimension_filter=_CRM_FILTER,
     )
-    crm_response = _run_report(crm_request, client)
-
-    crm_sessions = 0
-    # totalUsers em linhas dimensionadas pode duplicar usuarios; usamos max por linha como proxy conservador.
-    crm_users = 0
-    for row in crm_response.rows:
-        values = row.metric_values
-        if len(values) >= 2:
-            crm_sessions += int(values[0].value or 0)
-            crm_users = max(crm_users, int(values[1].value or 0))
 
     # Assistencia: usuarios de origem CRM convertendo em sessoes nao CRM.
-    assisted_filter = FilterExpression(
-        and_group=FilterExpressionList(
-            expressions=[
-                _build_first_user_crm_filter(),
-                FilterExpression(not_expression=_build_crm_filter()),
-            ]
-        )
-    )
     assisted_request = RunReportRequest(
         property=property_resource,
-        dimensions=[Dimension(name="sessionSourceMedium"), Dimension(name="date"), Dimension(name="sessionCampaignName")],
         metrics=[Metric(name="conversions"), Metric(name="purchaseRevenue")],
         date_ranges=[DateRange(start_date=start, end_date=end)],
-        dimension_filter=assisted_filter,
+        dimension_filter=_ASSISTED_CRM_FILTER,
+    )
+    crm_response, assisted_response = _run_batch_reports(
+        property_resource, [crm_request, assisted_request], client
     )
-    assisted_response = _run_report(assisted_request, client)
+
+    crm_sessions = 0
+    # Sem dimensoes o GA4 devolve uma linha de totais; totalUsers ja vem sem usuarios duplicados.
+    crm_users = 0
+    for row in crm_response.rows:
+        values = row.metric_values
+        if len(values) >= 2:
+            crm_sessions += int(values[0].value or 0)
+            crm_users += int(values[1].value or 0)
 
     assisted_purchases = 0
     assisted_revenue = 0.0
@@ -368,6 +535,8 @@ def get_crm_assisted_conversions(property_id: str, start_date: str, end_date: st
     }
 
 
+# A receita da coorte vai ate hoje, entao o resultado nunca e de periodo fechado.
+@_cached_report()
 def get_crm_ltv(property_id: str, start_date: str, end_date: str) -> dict[str, int | float]:
     """
     Calcula LTV da coorte CRM com firstSessionDate no periodo.
@@ -390,7 +559,7 @@ def get_crm_ltv(property_id: str, start_date: str, end_date: str) -> dict[str, i
     cohort_filter = FilterExpression(
         and_group=FilterExpressionList(
             expressions=[
-                _build_first_user_crm_filter(),
+                _FIRST_USER_CRM_FILTER,
                 _build_in_list_filter("firstSessionDate", _date_list_yyyymmdd(start, end)),
             ]
         )
@@ -403,10 +572,6 @@ def get_crm_ltv(property_id: str, start_date: str, end_date: str) -> dict[str, i
         date_ranges=[DateRange(start_date=start, end_date=end)],
         dimension_filter=cohort_filter,
     )
-    acquired_response = _run_report(acquired_request, client)
-    crm_new_users = 0
-    if acquired_response.rows and acquired_response.rows[0].metric_values:
-        crm_new_users = int(acquired_response.rows[0].metric_values[0].value or 0)
 
     # Receita total dessa coorte desde a aquisicao ate hoje.
     revenue_request = RunReportRequest(
@@ -415,7 +580,13 @@ def get_crm_ltv(property_id: str, start_date: str, end_date: str) -> dict[str, i
         date_ranges=[DateRange(start_date=start, end_date=today)],
         dimension_filter=cohort_filter,
     )
-    revenue_response = _run_report(revenue_request, client)
+    acquired_response, revenue_response = _run_batch_reports(
+        property_resource, [acquired_request, revenue_request], client
+    )
+    crm_new_users = 0
+    if acquired_response.rows and acquired_response.rows[0].metric_values:
+        crm_new_users = int(acquired_response.rows[0].metric_values[0].value or 0)
+
     total_revenue = 0.0
     if revenue_response.rows and revenue_response.rows[0].metric_values:
         total_revenue = float(revenue_response.rows[0].metric_values[0].value or 0.0)
@@ -438,6 +609,7 @@ def get_abandoned_cart_coupon_orders(
     return get_coupon_orders(property_id, start_date, end_date, ABANDONED_CART_COUPONS, crm_scope)
 
 
+@_cached_report(_end_date_argument)
 def get_coupon_orders(
     property_id: str, start_date: str, end_date: str, coupons: list[str], crm_scope: str = "all"
 ) -> dict[str, Any]:
@@ -471,20 +643,11 @@ def get_coupon_orders(
     client = _get_ga4_client()
 
     coupon_filter = _build_in_list_filter("orderCoupon", normalized_coupons)
-    purchase_filter = FilterExpression(
-        filter=Filter(
-            field_name="eventName",
-            string_filter=Filter.StringFilter(
-                match_type=Filter.StringFilter.MatchType.EXACT,
-                value="purchase",
-            ),
-        )
-    )
-    expressions = [coupon_filter, purchase_filter]
+    expressions = [coupon_filter, _PURCHASE_EVENT_FILTER]
     if normalized_scope == "only_crm":
-        expressions.append(_build_crm_filter())
+        expressions.append(_CRM_FILTER)
     elif normalized_scope == "non_crm":
-        expressions.append(_build_non_crm_filter())
+        expressions.append(_NON_CRM_FILTER)
 
     request = RunReportRequest(
         property=property_resource,
@@ -493,13 +656,11 @@ def get_coupon_orders(
         date_ranges=[DateRange(start_date=start, end_date=end)],
         dimension_filter=FilterExpression(and_group=FilterExpressionList(expressions=expressions)),
     )
-    response = _run_report(request, client)
-
     by_coupon = []
     total_transactions = 0
     total_revenue = 0.0
 
-    for row in response.rows:
+    for row in _iter_report_rows(request, client):
         dimension_values = row.dimension_values
         metric_values = row.metric_values
         if len(dimension_values) < 1 or len(metric_values) < 2:
@@ -547,6 +708,7 @@ def get_coupon_orders(
     }
 
 
+@_cached_report(_end_date_argument)
 def get_automation_revenue_by_campaign(
     property_id: str,
     start_date: str,
@@ -580,10 +742,8 @@ def get_automation_revenue_by_campaign(
         date_ranges=[DateRange(start_date=start, end_date=end)],
         dimension_filter=campaign_filter,
     )
-    response = _run_report(request, client)
-
     items = []
-    for row in response.rows:
+    for row in _iter_report_rows(request, client):
         dim_vals = row.dimension_values
         met_vals = row.metric_values
         if len(dim_vals) < 1 or len(met_vals) < 2:
@@ -16,9 +16,11 @@ from google.analytics.data_v1beta.types import (
 )
 
 from backend.ga4_client import (
-    _build_crm_filter,
+    _CRM_FILTER,
+    _cached_report,
     _get_ga4_client,
     _month_date_range,
+    _month_end_argument,
     _resolve_property_resource,
 )
 
@@ -30,6 +32,26 @@ CRM_FUNNEL_EVENTS = {
     "purchase": "purchase",
 }
 
+_CRM_FUNNEL_FILTER = FilterExpression(
+    and_group=FilterExpressionList(
+        expressions=[
+            _CRM_FILTER,
+            FilterExpression(
+                filter=Filter(
+                    field_name="eventName",
+                    in_list_filter=Filter.InListFilter(values=list(CRM_FUNNEL_EVENTS), case_sensitive=False),
+                )
+            ),
+        ]
+    )
+)
+
+_CRM_FUNNEL_TEMPLATE = RunReportRequest(
+    dimensions=[Dimension(name="eventName")],
+    metrics=[Metric(name="eventCount")],
+    dimension_filter=_CRM_FUNNEL_FILTER,
+)
+
 
 def _safe_rate(numerator: float, denominator: float) -> float:
     if denominator <= 0:
@@ -37,6 +59,28 @@ def _safe_rate(numerator: float, denominator: float) -> float:
     return round(numerator / denominator, 6)
 
 
+def _count_funnel_events(funnel: dict[str, int], property_resource: str, start_date: str, end_date: str) -> None:
+    request = RunReportRequest(_CRM_FUNNEL_TEMPLATE)
+    request.property = property_resource
+    request.date_ranges.append(DateRange(start_date=start_date, end_date=end_date))
+
+    client = _get_ga4_client()
+    try:
+        response = client.run_report(request=request, timeout=30)
+    except Exception as exc:
+        error_type = exc.__class__.__name__
+        raise RuntimeError(f"Falha ao consultar Google Analytics Data API [{error_type}]: {exc}") from exc
+
+    for row in response.rows:
+        if not row.dimension_values or not row.metric_values:
+            continue
+        mapped_key = CRM_FUNNEL_EVENTS.get(row.dimension_values[0].value)
+        if mapped_key is not None:
+            # eventCount e sempre inteiro no GA4; dispensa a passagem por float.
+            funnel[mapped_key] += int(row.metric_values[0].value or 0)
+
+
+@_cached_report(_month_end_argument)
 def get_crm_funnel(property_id: str, year: int | None = None, month: int | None = None) -> dict[str, Any]:
     """
     Retorna funil de CRM para um mes/ano.
@@ -55,48 +99,12 @@ def get_crm_funnel(property_id: str, year: int | None = None, month: int | None
     property_resource = _resolve_property_resource(property_id)
     start_date, end_date = _month_date_range(target_year, target_month)
 
-    event_filter = FilterExpression(
-        filter=Filter(
-            field_name="eventName",
-            in_list_filter=Filter.InListFilter(values=list(CRM_FUNNEL_EVENTS.keys()), case_sensitive=False),
-        )
-    )
-
-    request = RunReportRequest(
-        property=property_resource,
-        dimensions=[Dimension(name="eventName")],
-        metrics=[Metric(name="eventCount")],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-        dimension_filter=FilterExpression(
-            and_group=FilterExpressionList(expressions=[_build_crm_filter(), event_filter])
-        ),
-    )
-
-    client = _get_ga4_client()
-    try:
-        response = client.run_report(request=request, timeout=30)
-    except Exception as exc:
-        error_type = exc.__class__.__name__
-        raise RuntimeError(f"Falha ao consultar Google Analytics Data API [{error_type}]: {exc}") from exc
-
-    funnel = {
-        "sessions": 0,
-        "product_view": 0,
-        "add_to_cart": 0,
-        "checkout": 0,
-        "purchase": 0,
-    }
-
-    for row in response.rows:
-        if not row.dimension_values or not row.metric_values:
-            continue
-        event_name = row.dimension_values[0].value
-        metric_value = int(float(row.metric_values[0].value or 0))
-        mapped_key = CRM_FUNNEL_EVENTS.get(event_name)
-        if mapped_key:
-            funnel[mapped_key] += metric_value
+    funnel = dict.fromkeys(CRM_FUNNEL_EVENTS.values(), 0)
+    # Mes inteiro no futuro nao tem dados: devolve o funil zerado sem consultar o GA4.
+    if date.fromisoformat(start_date) <= today:
+        _count_funnel_events(funnel, property_resource, start_date, end_date)
 
-    sessions = float(funnel["sessions"])
+    sessions = funnel["sessions"]
     conversion_rates = {
         "view_rate": _safe_rate(funnel["product_view"], sessions),
         "cart_rate": _safe_rate(funnel["add_to_cart"], sessions),
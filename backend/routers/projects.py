@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
 from dateutil import parser as date_parser
+from fastapi import APIRouter, HTTPException
 
 from backend.schemas import (
     ProjectCreate,
@@ -19,6 +20,7 @@ from backend.schemas import (
 from backend.sheets_db import (
     SheetsDBError,
     SheetsDBTimeoutError,
+    bulk_create_tasks,
     create_project,
     create_task,
     delete_project,
@@ -27,12 +29,24 @@ from backend.sheets_db import (
     get_projects,
     get_task,
     get_tasks,
+    get_tasks_by_id,
     update_project,
     update_task,
 )
 
 router = APIRouter(prefix="/api", tags=["projects"])
 
+_TASK_STATUS_MAP = {
+    variant: status
+    for status in ("planned", "doing", "blocked", "done")
+    for variant in (status, status.capitalize(), status.upper())
+}
+_TASK_PRIORITY_MAP = {
+    variant: priority
+    for priority in ("low", "medium", "high")
+    for variant in (priority, priority.capitalize(), priority.upper())
+}
+
 
 def _handle_sheets_error(exc: Exception) -> None:
     if isinstance(exc, SheetsDBTimeoutError):
@@ -50,9 +64,15 @@ def _parse_date(value: str | None) -> date | None:
         return None
     if isinstance(value, date):
         return value
+    return _parse_date_text(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(value: str) -> date | None:
+    # Os mesmos valores de data se repetem entre tarefas; o dateutil so roda uma vez por texto.
     try:
         return date.fromisoformat(value)
-    except (ValueError, TypeError):
+    except ValueError:
         try:
             return date_parser.parse(value).date()
         except Exception:
@@ -60,36 +80,37 @@ def _parse_date(value: str | None) -> date | None:
 
 
 def _normalize_task_status(value: str | None) -> str:
-    allowed = {"planned", "doing", "blocked", "done"}
-    normalized = (value or "").strip().lower()
-    return normalized if normalized in allowed else "planned"
+    return _TASK_STATUS_MAP.get(value) or _TASK_STATUS_MAP.get((value or "").strip().lower(), "planned")
 
 
 def _normalize_task_priority(value: str | None) -> str:
-    allowed = {"low", "medium", "high"}
-    normalized = (value or "").strip().lower()
-    return normalized if normalized in allowed else "medium"
+    return _TASK_PRIORITY_MAP.get(value) or _TASK_PRIORITY_MAP.get((value or "").strip().lower(), "medium")
+
 
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
 
-def _serialize_task(task: dict) -> dict:
-    today = datetime.utcnow().date()
+
+def _serialize_task(task: dict, today: date | None = None) -> dict:
+    today = today or _utc_today()
     end_date = _parse_date(task.get("end_date"))
     start_date = _parse_date(task.get("start_date"))
     status = _normalize_task_status(task.get("status"))
     priority = _normalize_task_priority(task.get("priority"))
 
-    is_overdue = bool(end_date and status != "done" and today > end_date)
-
-    if is_overdue:
-        deadline_state = "overdue"
-    elif not end_date:
+    if end_date is None:
         deadline_state = "normal"
-    elif end_date == today:
-        deadline_state = "due_today"
-    elif 0 < (end_date - today).days <= 2:
-        deadline_state = "due_soon"
     else:
-        deadline_state = "normal"
+        days_left = (end_date - today).days
+        if days_left < 0 and status != "done":
+            deadline_state = "overdue"
+        elif days_left == 0:
+            deadline_state = "due_today"
+        elif 0 < days_left <= 2:
+            deadline_state = "due_soon"
+        else:
+            deadline_state = "normal"
+    is_overdue = deadline_state == "overdue"
 
     progress = task.get("progress", 0)
     try:
@@ -97,11 +118,13 @@ def _serialize_task(task: dict) -> dict:
     except Exception:
         progress_int = 0
 
-    created_at_raw = task.get("created_at")
-    try:
-        created_at = datetime.fromisoformat(str(created_at_raw).replace("Z", "+00:00")).isoformat().replace("+00:00", "Z")
-    except Exception:
-        created_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    created_at = task.get("created_at")
+    if not isinstance(created_at, datetime):
+        try:
+            # Python 3.11+ aceita o sufixo "Z" diretamente.
+            created_at = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            created_at = datetime.now(timezone.utc).replace(microsecond=0)
 
     title = (task.get("title") or "").strip() or "Tarefa sem titulo"
 
@@ -111,8 +134,8 @@ def _serialize_task(task: dict) -> dict:
         "depends_on_task_id": task.get("depends_on_task_id"),
         "title": title,
         "description": task.get("description"),
-        "start_date": start_date.isoformat() if start_date else None,
-        "end_date": end_date.isoformat() if end_date else None,
+        "start_date": start_date,
+        "end_date": end_date,
         "progress": progress_int,
         "status": status,
         "priority": priority,
@@ -144,19 +167,42 @@ def _to_task_or_404(task_id: int) -> dict:
     return task
 
 
-def _validate_dependency(project_id: int, task_id: int | None, depends_on_task_id: int | None) -> None:
+def _load_project_tasks(project_id: int) -> tuple[dict, ...]:
+    try:
+        return get_tasks(project_id)
+    except SheetsDBError as exc:
+        _handle_sheets_error(exc)
+
+
+def _load_tasks_by_id() -> dict[int, dict]:
+    try:
+        return get_tasks_by_id()
+    except SheetsDBError as exc:
+        _handle_sheets_error(exc)
+
+
+def _task_from_map_or_404(tasks: dict[int, dict], task_id: int) -> dict:
+    task = tasks.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Tarefa nao encontrada")
+    return task
+
+
+def _validate_dependency(
+    tasks: dict[int, dict], project_id: int, task_id: int | None, depends_on_task_id: int | None
+) -> None:
     if depends_on_task_id is None:
         return
 
     if task_id is not None and depends_on_task_id == task_id:
         raise HTTPException(status_code=400, detail="Uma tarefa nao pode depender dela mesma")
 
-    predecessor = _to_task_or_404(depends_on_task_id)
+    predecessor = _task_from_map_or_404(tasks, depends_on_task_id)
     if predecessor["project_id"] != project_id:
         raise HTTPException(status_code=400, detail="A dependencia deve ser uma tarefa do mesmo projeto")
 
 
-def _enforce_dependency_done_rule(task: dict, next_status: str | None) -> None:
+def _enforce_dependency_done_rule(tasks: dict[int, dict], task: dict, next_status: str | None) -> None:
     if next_status != "done":
         return
 
@@ -164,7 +210,7 @@ def _enforce_dependency_done_rule(task: dict, next_status: str | None) -> None:
     if not predecessor_id:
         return
 
-    predecessor = _to_task_or_404(int(predecessor_id))
+    predecessor = _task_from_map_or_404(tasks, int(predecessor_id))
     if predecessor.get("status") != "done":
         raise HTTPException(
             status_code=400,
@@ -173,13 +219,14 @@ def _enforce_dependency_done_rule(task: dict, next_status: str | None) -> None:
 
 
 @router.get("/projects", response_model=list[ProjectOut])
-def list_projects() -> list[dict]:
+def list_projects() -> tuple[dict, ...]:
     try:
         projects = get_projects()
     except SheetsDBError as exc:
         _handle_sheets_error(exc)
 
-    return sorted(projects, key=lambda item: item.get("created_at", ""), reverse=True)
+    # get_projects() ja vem em ordem de criacao; a listagem mostra os mais recentes primeiro.
+    return projects[::-1]
 
 
 @router.post("/projects", response_model=ProjectOut, status_code=201)
@@ -233,26 +280,24 @@ def delete_project_endpoint(project_id: int) -> dict[str, str]:
 @router.get("/projects/{project_id}/tasks", response_model=list[TaskOut])
 def list_project_tasks(project_id: int) -> list[dict]:
     _to_project_or_404(project_id)
-    try:
-        tasks = get_tasks(project_id)
-    except SheetsDBError as exc:
-        _handle_sheets_error(exc)
+    tasks = _load_project_tasks(project_id)
 
-    tasks_sorted = sorted(tasks, key=lambda item: item.get("created_at", ""))
-    return [_serialize_task(item) for item in tasks_sorted]
+    today = _utc_today()
+    return [_serialize_task(item, today) for item in tasks]
 
 
 @router.post("/projects/{project_id}/tasks", response_model=TaskOut, status_code=201)
 def create_task_endpoint(project_id: int, payload: TaskCreate) -> dict:
     _to_project_or_404(project_id)
+    tasks = _load_tasks_by_id()
     _validate_date_range(payload.start_date, payload.end_date)
-    _validate_dependency(project_id=project_id, task_id=None, depends_on_task_id=payload.depends_on_task_id)
+    _validate_dependency(tasks, project_id=project_id, task_id=None, depends_on_task_id=payload.depends_on_task_id)
 
     task_data = payload.model_dump()
     if task_data.get("status") == "done":
         task_data["progress"] = 100
 
-    _enforce_dependency_done_rule(task_data, task_data.get("status"))
+    _enforce_dependency_done_rule(tasks, task_data, task_data.get("status"))
 
     try:
         created = create_task(project_id, task_data)
@@ -262,17 +307,46 @@ def create_task_endpoint(project_id: int, payload: TaskCreate) -> dict:
     return _serialize_task(created)
 
 
+@router.post("/projects/{project_id}/tasks/bulk", response_model=list[TaskOut], status_code=201)
+def bulk_create_tasks_endpoint(project_id: int, payloads: list[TaskCreate]) -> list[dict]:
+    _to_project_or_404(project_id)
+    tasks = _load_tasks_by_id()
+
+    # Valida o lote inteiro antes de gravar: ou todas as tarefas entram, ou nenhuma.
+    tasks_data = []
+    for payload in payloads:
+        _validate_date_range(payload.start_date, payload.end_date)
+        _validate_dependency(tasks, project_id=project_id, task_id=None, depends_on_task_id=payload.depends_on_task_id)
+
+        task_data = payload.model_dump()
+        if task_data.get("status") == "done":
+            task_data["progress"] = 100
+
+        _enforce_dependency_done_rule(tasks, task_data, task_data.get("status"))
+        tasks_data.append(task_data)
+
+    try:
+        created = bulk_create_tasks(project_id, tasks_data)
+    except SheetsDBError as exc:
+        _handle_sheets_error(exc)
+
+    return [_serialize_task(task) for task in created]
+
+
 @router.put("/tasks/{task_id}", response_model=TaskOut)
 def update_task_endpoint(task_id: int, payload: TaskUpdate) -> dict:
-    current = _to_task_or_404(task_id)
+    # Uma unica leitura da aba de tarefas atende a tarefa atual e as dependencias.
+    tasks = _load_tasks_by_id()
+    current = _task_from_map_or_404(tasks, task_id)
 
     update_data = payload.model_dump(exclude_unset=True)
-    start_date = update_data.get("start_date", _parse_date(current.get("start_date")))
-    end_date = update_data.get("end_date", _parse_date(current.get("end_date")))
+    start_date = update_data["start_date"] if "start_date" in update_data else _parse_date(current.get("start_date"))
+    end_date = update_data["end_date"] if "end_date" in update_data else _parse_date(current.get("end_date"))
     _validate_date_range(start_date, end_date)
 
     if "depends_on_task_id" in update_data:
         _validate_dependency(
+            tasks,
             project_id=current["project_id"],
             task_id=current["id"],
             depends_on_task_id=update_data.get("depends_on_task_id"),
@@ -280,7 +354,7 @@ def update_task_endpoint(task_id: int, payload: TaskUpdate) -> dict:
 
     next_status = update_data.get("status", current.get("status"))
     composed = {**current, **update_data}
-    _enforce_dependency_done_rule(composed, next_status)
+    _enforce_dependency_done_rule(tasks, composed, next_status)
 
     if next_status == "done":
         update_data["progress"] = 100
@@ -311,8 +385,9 @@ def delete_task_endpoint(task_id: int) -> dict[str, str]:
 
 @router.patch("/tasks/{task_id}/progress", response_model=TaskOut)
 def update_task_progress(task_id: int, payload: TaskProgressUpdate) -> dict:
-    current = _to_task_or_404(task_id)
-    _enforce_dependency_done_rule(current, current.get("status"))
+    tasks = _load_tasks_by_id()
+    current = _task_from_map_or_404(tasks, task_id)
+    _enforce_dependency_done_rule(tasks, current, current.get("status"))
 
     next_progress = 100 if current.get("status") == "done" else payload.progress
 
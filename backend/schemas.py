@@ -39,7 +39,7 @@ class ProjectOut(ProjectBase):
     id: int
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TaskBase(BaseModel):
@@ -79,4 +79,4 @@ class TaskOut(TaskBase):
     is_overdue: bool
     deadline_state: DeadlineState
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
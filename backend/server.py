@@ -2,29 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import binascii
 import hashlib
+import hmac
 import os
-import re
 import secrets
 import sqlite3
+import stat
+import threading
 import unicodedata
 from base64 import b64decode
-from datetime import date
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
-import pandas as pd
+import orjson
 from dateutil import parser
-from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 from backend.event_sources import (
+    SheetValues,
     append_calendar_row,
     delete_calendar_row,
+    get_calendar_row,
     get_sheet_headers,
+    invalidate_sheet_cache,
     load_google_sheet,
     update_calendar_row,
 )
@@ -37,6 +50,7 @@ from backend.ga4_client import (
     get_crm_monthly_report,
     get_crm_range_report,
     get_sessions_yesterday,
+    warmup_ga4_client,
 )
 from backend.ga4_funnel import get_crm_funnel
 from backend.routers.projects import router as projects_router
@@ -54,10 +68,23 @@ AUTH_USERNAME_2 = os.getenv("AUTH_USERNAME_2", "").strip()
 AUTH_PASSWORD_2 = os.getenv("AUTH_PASSWORD_2", "").strip()
 AUTH_MODE = os.getenv("AUTH_MODE", "multi").strip().lower()
 
-USERNAME_PATTERN = re.compile(r"^[a-z0-9._-]+$")
+# Tabela que apaga os caracteres permitidos em usuarios ([a-z0-9._-]); sobrou algo, e invalido.
+_USERNAME_INVALID_CHARS = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789._-")
 PASSWORD_MIN_LENGTH = 6
 
-app = FastAPI(title="CRM Campaign Planner API")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Aquece o cliente GA4 em segundo plano para a primeira consulta nao pagar auth + TLS.
+    threading.Thread(target=warmup_ga4_client, name="ga4-warmup", daemon=True).start()
+    if not is_single_auth_mode() and not has_dual_env_auth():
+        # Uma vez por worker, na subida; o bootstrap e idempotente entre workers concorrentes.
+        await asyncio.to_thread(init_user_store)
+        await asyncio.to_thread(ensure_bootstrap_admin)
+    yield
+
+
+app = FastAPI(title="CRM Campaign Planner API", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(projects_router)
 app.include_router(open_data_router)
 
@@ -106,23 +133,74 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Respostas JSON (eventos, relatorios) repetem muitas chaves e comprimem bem.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
+# Uma conexao SQLite por processo (o middleware consulta usuarios a cada requisicao),
+# serializada por lock; "with get_db_connection() as conn" continua sendo uma transacao.
+_auth_conn: sqlite3.Connection | None = None
+_auth_conn_lock = threading.RLock()
 
-def get_db_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(AUTH_DB_PATH)
+
+def _open_auth_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(AUTH_DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Tabela minuscula lida a cada requisicao: paginas mapeadas em memoria, sem pread.
+    conn.execute("PRAGMA mmap_size=67108864")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+@contextmanager
+def get_db_connection() -> Iterator[sqlite3.Connection]:
+    global _auth_conn
+    with _auth_conn_lock:
+        if _auth_conn is None:
+            _auth_conn = _open_auth_connection()
+        with _auth_conn:
+            yield _auth_conn
+
+
+@atexit.register
+def _close_auth_connection() -> None:
+    global _auth_conn
+    with _auth_conn_lock:
+        if _auth_conn is not None:
+            _auth_conn.close()
+            _auth_conn = None
+
+
 def normalize_username(username: str) -> str:
     normalized = username.strip().lower()
     if not normalized:
         raise ValueError("Usuario vazio")
-    if not USERNAME_PATTERN.fullmatch(normalized):
+    if normalized.translate(_USERNAME_INVALID_CHARS):
         raise ValueError("Use apenas letras, numeros, ponto, underline e hifen")
     return normalized
 
 
+def _password_digest(password: str) -> bytes:
+    # Digest de tamanho fixo: compare_digest nao vaza o tamanho da senha.
+    return hashlib.sha256(password.encode("utf-8")).digest()
+
+
+def _env_credential(username: str, password: str) -> tuple[str, bytes] | None:
+    """Usuario normalizado e digest da senha de uma credencial fixa, calculados na carga do modulo."""
+    if not username:
+        return None
+    try:
+        return normalize_username(username), _password_digest(password)
+    except ValueError:
+        return None
+
+
+_ENV_CREDENTIAL = _env_credential(AUTH_USERNAME, AUTH_PASSWORD)
+_ENV_CREDENTIAL_2 = _env_credential(AUTH_USERNAME_2, AUTH_PASSWORD_2)
+
+
 def hash_password(password: str) -> str:
     salt = os.urandom(16)
     iterations = 150_000
@@ -150,6 +228,37 @@ def verify_password(password: str, password_hash: str) -> bool:
     return secrets.compare_digest(candidate, expected_digest)
 
 
+# Basic Auth reenvia a mesma senha em toda requisicao; guardamos so os acertos, indexados
+# pelo hash armazenado + HMAC da senha com chave aleatoria do processo (a senha nunca fica em memoria).
+_VERIFIED_PASSWORDS_MAX = 1024
+_verified_passwords_key = os.urandom(32)
+_verified_passwords_lock = threading.Lock()
+_verified_passwords: OrderedDict[tuple[str, bytes], None] = OrderedDict()
+
+
+def verify_password_cached(password: str, password_hash: str) -> bool:
+    fingerprint = hmac.new(_verified_passwords_key, password.encode("utf-8"), hashlib.sha256).digest()
+    cache_key = (password_hash, fingerprint)
+    with _verified_passwords_lock:
+        if cache_key in _verified_passwords:
+            _verified_passwords.move_to_end(cache_key)
+            return True
+
+    if not verify_password(password, password_hash):
+        return False
+
+    with _verified_passwords_lock:
+        _verified_passwords[cache_key] = None
+        while len(_verified_passwords) > _VERIFIED_PASSWORDS_MAX:
+            _verified_passwords.popitem(last=False)
+    return True
+
+
+def _clear_verified_passwords() -> None:
+    with _verified_passwords_lock:
+        _verified_passwords.clear()
+
+
 def init_user_store() -> None:
     with get_db_connection() as conn:
         conn.execute(
@@ -162,6 +271,7 @@ def init_user_store() -> None:
             )
             """
         )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_users_role ON users (role)")
         conn.commit()
 
 
@@ -173,16 +283,24 @@ def get_user(username: str) -> sqlite3.Row | None:
         ).fetchone()
 
 
-def user_count() -> int:
+def get_user_with_admin_count(username: str) -> tuple[sqlite3.Row | None, int]:
+    """Usuario e total de administradores numa unica consulta."""
     with get_db_connection() as conn:
-        row = conn.execute("SELECT COUNT(*) AS total FROM users").fetchone()
-    return int(row["total"]) if row else 0
+        row = conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM users WHERE role = 'admin') AS admin_total,
+                u.username, u.password_hash, u.role, u.created_at
+            FROM (SELECT 1) LEFT JOIN users u ON u.username = ?
+            """,
+            (username,),
+        ).fetchone()
+    return (row if row["username"] is not None else None), int(row["admin_total"])
 
 
-def admin_count() -> int:
+def users_exist() -> bool:
     with get_db_connection() as conn:
-        row = conn.execute("SELECT COUNT(*) AS total FROM users WHERE role = 'admin'").fetchone()
-    return int(row["total"]) if row else 0
+        return bool(conn.execute("SELECT EXISTS (SELECT 1 FROM users)").fetchone()[0])
 
 
 def create_user_record(username: str, password: str, role: Literal["admin", "user"]) -> None:
@@ -193,6 +311,7 @@ def create_user_record(username: str, password: str, role: Literal["admin", "use
             (username, password_hash, role),
         )
         conn.commit()
+    _clear_verified_passwords()
 
 
 def update_user_password(username: str, new_password: str) -> None:
@@ -203,6 +322,7 @@ def update_user_password(username: str, new_password: str) -> None:
             (new_password_hash, username),
         )
         conn.commit()
+    _clear_verified_passwords()
 
 
 def update_user_role(username: str, role: Literal["admin", "user"]) -> None:
@@ -218,7 +338,7 @@ def ensure_bootstrap_admin() -> None:
     """Cria admin inicial pelo .env/Render quando ainda nao ha usuarios."""
     if is_single_auth_mode():
         return
-    if user_count() > 0:
+    if users_exist():
         return
     if not AUTH_USERNAME or not AUTH_PASSWORD:
         return
@@ -231,20 +351,46 @@ def ensure_bootstrap_admin() -> None:
     if len(AUTH_PASSWORD) < PASSWORD_MIN_LENGTH:
         return
 
-    create_user_record(username, AUTH_PASSWORD, "admin")
+    password_hash = hash_password(AUTH_PASSWORD)
+    # Varios workers sobem juntos: so o primeiro INSERT com a tabela vazia vale.
+    with get_db_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO users (username, password_hash, role)
+            SELECT ?, ?, 'admin' WHERE NOT EXISTS (SELECT 1 FROM users)
+            """,
+            (username, password_hash),
+        )
+
+
+# So o resultado positivo fica em cache: com usuarios cadastrados a auth nao desliga pela API,
+# e outro worker que cadastre o primeiro usuario nunca deixa este preso em "sem auth".
+_auth_enabled_cache = False
 
 
 def is_auth_enabled() -> bool:
     """Em single usa credencial fixa; em multi usa usuarios cadastrados."""
+    global _auth_enabled_cache
     if is_single_auth_mode():
         return bool(AUTH_USERNAME and AUTH_PASSWORD)
     if has_dual_env_auth():
         return True
-    return user_count() > 0
+    if not _auth_enabled_cache:
+        _auth_enabled_cache = users_exist()
+    return _auth_enabled_cache
+
 
+def _invalidate_auth_enabled() -> None:
+    global _auth_enabled_cache
+    _auth_enabled_cache = False
 
-def parse_basic_credentials(authorization_header: str | None) -> tuple[str, str] | None:
-    if not authorization_header or not authorization_header.startswith("Basic "):
+
+def parse_basic_credentials(authorization_header: bytes | str | None) -> tuple[str, str] | None:
+    if not authorization_header:
+        return None
+    if isinstance(authorization_header, str):
+        authorization_header = authorization_header.encode("latin-1", "ignore")
+    if not authorization_header.startswith(b"Basic "):
         return None
 
     encoded_credentials = authorization_header[6:].strip()
@@ -253,15 +399,26 @@ def parse_basic_credentials(authorization_header: str | None) -> tuple[str, str]
 
     try:
         decoded_bytes = b64decode(encoded_credentials, validate=True)
-        decoded_credentials = decoded_bytes.decode("utf-8")
-    except Exception:
+    except binascii.Error:
         return None
 
-    username, separator, password = decoded_credentials.partition(":")
+    # Divide ainda em bytes e decodifica usuario/senha uma unica vez no final.
+    username, separator, password = decoded_bytes.partition(b":")
     if not separator:
         return None
 
-    return username, password
+    try:
+        return username.decode("utf-8"), password.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _raw_authorization_header(request: Request) -> bytes | None:
+    # Le direto dos cabecalhos ASGI (nomes ja em minusculas), sem montar o objeto Headers.
+    for name, value in request.scope["headers"]:
+        if name == b"authorization":
+            return value
+    return None
 
 
 def authenticate_user(username_raw: str, password: str) -> AuthUser | None:
@@ -270,37 +427,33 @@ def authenticate_user(username_raw: str, password: str) -> AuthUser | None:
             username = normalize_username(username_raw)
         except ValueError:
             return None
+        password_digest = _password_digest(password)
 
-        try:
-            expected_admin = normalize_username(AUTH_USERNAME_2)
-        except ValueError:
-            expected_admin = None
-
-        if expected_admin and secrets.compare_digest(username, expected_admin):
-            if secrets.compare_digest(password, AUTH_PASSWORD_2):
-                return AuthUser(username=expected_admin, role="admin")
+        if _ENV_CREDENTIAL_2 and secrets.compare_digest(username, _ENV_CREDENTIAL_2[0]):
+            if secrets.compare_digest(password_digest, _ENV_CREDENTIAL_2[1]):
+                return AuthUser(username=_ENV_CREDENTIAL_2[0], role="admin")
             return None
 
-        try:
-            expected_viewer = normalize_username(AUTH_USERNAME)
-        except ValueError:
+        if _ENV_CREDENTIAL is None:
             return None
-
-        if secrets.compare_digest(username, expected_viewer) and secrets.compare_digest(password, AUTH_PASSWORD):
+        expected_viewer, expected_digest = _ENV_CREDENTIAL
+        if secrets.compare_digest(username, expected_viewer) and secrets.compare_digest(password_digest, expected_digest):
             return AuthUser(username=expected_viewer, role="user")
 
         return None
 
     if is_single_auth_mode():
+        if _ENV_CREDENTIAL is None:
+            return None
         try:
             username = normalize_username(username_raw)
-            expected_username = normalize_username(AUTH_USERNAME)
         except ValueError:
             return None
 
+        expected_username, expected_digest = _ENV_CREDENTIAL
         if not secrets.compare_digest(username, expected_username):
             return None
-        if not secrets.compare_digest(password, AUTH_PASSWORD):
+        if not secrets.compare_digest(_password_digest(password), expected_digest):
             return None
 
         return AuthUser(username=expected_username, role="admin")
@@ -314,7 +467,7 @@ def authenticate_user(username_raw: str, password: str) -> AuthUser | None:
     if not user:
         return None
 
-    if not verify_password(password, user["password_hash"]):
+    if not verify_password_cached(password, user["password_hash"]):
         return None
 
     return AuthUser(username=user["username"], role=user["role"])
@@ -339,7 +492,7 @@ async def basic_auth_middleware(request: Request, call_next: Any) -> Response:
     if not is_auth_enabled():
         return await call_next(request)
 
-    credentials = parse_basic_credentials(request.headers.get("Authorization"))
+    credentials = parse_basic_credentials(_raw_authorization_header(request))
     if not credentials:
         return unauthorized_response()
 
@@ -373,35 +526,61 @@ def ensure_multi_user_mode() -> None:
         )
 
 
-if not is_single_auth_mode() and not has_dual_env_auth():
-    init_user_store()
-    ensure_bootstrap_admin()
-
 # Assets gerados pelo Vite (build React)
+class ImmutableStaticFiles(StaticFiles):
+    """Assets do Vite levam hash no nome: podem ficar no cache do navegador sem revalidar."""
+
+    async def get_response(self, path: str, scope: Any) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 app.mount(
     "/assets",
-    StaticFiles(directory=str(FRONTEND_DIST_DIR / "assets"), check_dir=False),
+    ImmutableStaticFiles(directory=str(FRONTEND_DIST_DIR / "assets"), check_dir=False),
     name="assets",
 )
 
 GA4_PROPERTY_ID = os.getenv("GA4_PROPERTY_ID", "").strip()
 
 
+def _fold_to_ascii(text: str) -> str:
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+# Latin-1 + Latin Extended-A (acentos do portugues e afins) pre-convertidos para ASCII.
+_ASCII_FOLD_TABLE = str.maketrans({chr(code): _fold_to_ascii(chr(code)) for code in range(0x80, 0x180)})
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str | None) -> str:
     """Normaliza texto para comparacao tolerante a acentos e caixa."""
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFKD", text)
-    ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
+    if text.isascii():
+        # Caso comum (cabecalhos, canais): nada a decompor.
+        return text.strip().lower()
+    ascii_only = text.translate(_ASCII_FOLD_TABLE)
+    if not ascii_only.isascii():
+        ascii_only = _fold_to_ascii(ascii_only)
     return ascii_only.strip().lower()
 
 
-def find_column(headers: list[str] | None, aliases: list[str]) -> str | None:
-    """Encontra a primeira coluna compativel com algum alias."""
+def resolve_columns(headers: list[str] | None, aliases_by_key: dict[str, list[str]]) -> dict[str, str | None]:
+    """Resolve varias colunas de uma vez, normalizando os cabecalhos uma unica vez."""
     if not headers:
-        return None
+        return dict.fromkeys(aliases_by_key)
+    normalized_headers = _normalize_headers(headers)
+    return {key: _match_column(normalized_headers, aliases) for key, aliases in aliases_by_key.items()}
+
+
+def _normalize_headers(headers: list[str]) -> dict[str, str]:
+    return {normalize_text(header): header for header in headers if header}
 
-    normalized_headers = {normalize_text(header): header for header in headers if header}
+
+def _match_column(normalized_headers: dict[str, str], aliases: list[str]) -> str | None:
     for alias in aliases:
         alias_norm = normalize_text(alias)
         for normalized_header, original_header in normalized_headers.items():
@@ -410,28 +589,96 @@ def find_column(headers: list[str] | None, aliases: list[str]) -> str | None:
     return None
 
 
+# Aliases aceitos para cada coluna da planilha do calendario.
+_EVENT_COLUMN_ALIASES: dict[str, list[str]] = {
+    "data": ["data"],
+    "campanha": ["campanha", "assunto", "titulo", "title"],
+    "canal": ["canal", "channel"],
+    "direcionamento": ["direcionamento", "direcion", "target", "segmento"],
+    "status": ["status", "situacao", "situação"],
+    "produto": ["produto", "product"],
+    "observacao": ["observacao", "obs", "observation"],
+}
+
+
+# Primeiro trecho que casar com o canal normalizado define a cor.
+_CHANNEL_COLORS = (("email", "#0071E3"), ("whats", "#25D366"), ("sms", "#FF9F0A"))
+_DEFAULT_CHANNEL_COLOR = "#8E8E93"
+
+
+@lru_cache(maxsize=512)
 def get_channel_color(channel: str) -> str:
+    """Cor do canal; poucos canais distintos se repetem, entao cada um e classificado uma vez."""
     channel_norm = normalize_text(channel)
-    if "email" in channel_norm:
-        return "#0071E3"
-    if "whats" in channel_norm:
-        return "#25D366"
-    if "sms" in channel_norm:
-        return "#FF9F0A"
-    return "#8E8E93"
-
-
-def fetch_and_parse_csv_from_dataframe(dataframe: pd.DataFrame) -> list[dict[str, Any]]:
-    """Converte um DataFrame de campanhas para eventos FullCalendar."""
-    headers = dataframe.columns.tolist()
-
-    col_data = find_column(headers, ["data"])
-    col_campanha = find_column(headers, ["campanha", "assunto", "titulo", "title"])
-    col_canal = find_column(headers, ["canal", "channel"])
-    col_direcionamento = find_column(headers, ["direcionamento", "direcion", "target", "segmento"])
-    col_status = find_column(headers, ["status", "situacao", "situação"])
-    col_produto = find_column(headers, ["produto", "product"])
-    col_observacao = find_column(headers, ["observacao", "obs", "observation"])
+    for keyword, color in _CHANNEL_COLORS:
+        if keyword in channel_norm:
+            return color
+    return _DEFAULT_CHANNEL_COLOR
+
+
+def _stripped_column(rows: list[list[str]], position: int | None) -> list[str]:
+    """Le uma coluna inteira (pela posicao) ja sem espacos; coluna ausente vira lista de vazios."""
+    if position is None:
+        return [""] * len(rows)
+    return [row[position].strip() if position < len(row) else "" for row in rows]
+
+
+# Formatos conhecidos alem do DD/MM/YYYY com zeros; o dateutil so entra quando nenhum casa.
+_EVENT_DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y %H:%M")
+
+
+def parse_event_dates(date_strs: list[str]) -> list[str | None]:
+    """Converte a coluna de datas para YYYY-MM-DD; None quando a data e invalida.
+
+    Cada valor distinto e convertido uma unica vez: DD/MM/YYYY sai por fatiamento direto,
+    o que sobrar passa pelos formatos conhecidos e, por ultimo, pelo dateutil.
+    """
+    parsed: dict[str, str | None] = {}
+    iso_dates: list[str | None] = []
+    for date_str in date_strs:
+        if date_str not in parsed:
+            parsed[date_str] = _parse_event_date(date_str) if date_str else None
+        iso_dates.append(parsed[date_str])
+    return iso_dates
+
+
+def _parse_event_date(date_str: str) -> str | None:
+    day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+    if len(date_str) == 10 and date_str[2] == date_str[5] == "/" and (day + month + year).isdigit():
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            pass
+    for date_format in _EVENT_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    try:
+        return parser.parse(date_str, dayfirst=True).strftime("%Y-%m-%d")
+    except Exception:
+        return None
+
+
+def _row_fingerprint(values: list[str]) -> str:
+    """Hash curto do conteudo cru de uma linha; celulas vazias no fim nao contam."""
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    return hashlib.blake2b(orjson.dumps(values[:end]), digest_size=8).hexdigest()
+
+
+def fetch_and_parse_sheet_rows(headers: list[str], rows: list[list[str]]) -> list[dict[str, Any]]:
+    """Converte as linhas cruas da planilha de campanhas para eventos FullCalendar."""
+
+    columns_by_key = resolve_columns(headers, _EVENT_COLUMN_ALIASES)
+    col_data = columns_by_key["data"]
+    col_campanha = columns_by_key["campanha"]
+    col_canal = columns_by_key["canal"]
+    col_direcionamento = columns_by_key["direcionamento"]
+    col_status = columns_by_key["status"]
+    col_produto = columns_by_key["produto"]
+    col_observacao = columns_by_key["observacao"]
 
     missing_required: list[str] = []
     if not col_data:
@@ -444,38 +691,40 @@ def fetch_and_parse_csv_from_dataframe(dataframe: pd.DataFrame) -> list[dict[str
             detail=f"Colunas obrigatorias ausentes no CSV: {missing_text}",
         )
 
+    # Posicao da primeira ocorrencia de cada cabecalho; nomes repetidos nao quebram a leitura.
+    positions = {header: idx for idx, header in reversed(list(enumerate(headers)))}
+    date_strs = _stripped_column(rows, positions.get(col_data))
+    channels = _stripped_column(rows, positions.get(col_canal))
+    columns = zip(
+        date_strs,
+        parse_event_dates(date_strs),
+        _stripped_column(rows, positions.get(col_campanha)),
+        channels,
+        map(get_channel_color, channels),
+        _stripped_column(rows, positions.get(col_direcionamento)),
+        _stripped_column(rows, positions.get(col_status)),
+        _stripped_column(rows, positions.get(col_produto)),
+        _stripped_column(rows, positions.get(col_observacao)),
+    )
     events: list[dict[str, Any]] = []
 
-    for idx, row in enumerate(dataframe.to_dict(orient="records")):
+    for idx, row in enumerate(columns):
+        date_str, start, campaign, channel, color, direcionamento, status, product, observation = row
         sheet_row = idx + 2  # row 1 = headers; data starts at row 2
-        date_str = (row.get(col_data) or "").strip()
-        campaign = (row.get(col_campanha) or "").strip()
-        channel = (row.get(col_canal) or "").strip() if col_canal else ""
-        direcionamento = (row.get(col_direcionamento) or "").strip() if col_direcionamento else ""
-        status = (row.get(col_status) or "").strip() if col_status else ""
-
-        if not date_str:
-            continue
-
-        try:
-            parsed_date = parser.parse(date_str, dayfirst=True)
-        except Exception:
+        if not start:
             continue
 
-        product = (row.get(col_produto) or "").strip() if col_produto else ""
-        observation = (row.get(col_observacao) or "").strip() if col_observacao else ""
-        color = get_channel_color(channel)
         title_parts = [part for part in [channel, direcionamento] if part]
         display_title = " - ".join(title_parts) if title_parts else (campaign or "Campanha sem titulo")
 
         events.append(
             {
-                "id": f"{parsed_date.strftime('%Y-%m-%d')}_{display_title}",
+                "id": f"{start}_{display_title}",
                 "title": display_title,
-                "start": parsed_date.strftime("%Y-%m-%d"),
+                "start": start,
                 "allDay": True,
-                "backgroundColor": color,
-                "borderColor": color,
+                # "color" do FullCalendar vale para fundo e borda.
+                "color": color,
                 "extendedProps": {
                     "canal": channel,
                     "direcionamento": direcionamento,
@@ -485,6 +734,8 @@ def fetch_and_parse_csv_from_dataframe(dataframe: pd.DataFrame) -> list[dict[str
                     "observacao": observation,
                     "data_original": date_str,
                     "_row": sheet_row,
+                    # Enviado de volta no If-Match de PUT/DELETE para conferir que a linha nao mudou.
+                    "_row_hash": _row_fingerprint(rows[idx]),
                 },
             }
         )
@@ -492,18 +743,42 @@ def fetch_and_parse_csv_from_dataframe(dataframe: pd.DataFrame) -> list[dict[str
     return events
 
 
+_events_cache: tuple[SheetValues | None, list[dict[str, Any]], str] = (None, [], "")
+
+
 def fetch_and_parse_csv() -> list[dict[str, Any]]:
-    """Le a planilha do Google Sheets e converte para eventos FullCalendar."""
-    dataframe = load_google_sheet()
-    if dataframe.empty:
-        return []
-    return fetch_and_parse_csv_from_dataframe(dataframe)
+    """Le a planilha do Google Sheets e converte para eventos FullCalendar.
+
+    Enquanto load_google_sheet devolver as mesmas linhas em cache, a lista de eventos
+    ja convertida e reaproveitada (e compartilhada; nao deve ser alterada).
+    """
+    return load_events()[0]
+
+
+def load_events() -> tuple[list[dict[str, Any]], str]:
+    """Como fetch_and_parse_csv, mas devolve tambem a versao (hash do conteudo) dos eventos."""
+    global _events_cache
+    sheet = load_google_sheet()
+    cached_sheet, cached_events, cached_version = _events_cache
+    if cached_sheet is sheet:
+        return cached_events, cached_version
+
+    headers, rows = sheet
+    events = fetch_and_parse_sheet_rows(headers, rows) if headers and rows else []
+    version = hashlib.blake2b(orjson.dumps(events), digest_size=8).hexdigest()
+    _events_cache = (sheet, events, version)
+    return events, version
+
+
+# Resolvidos uma vez; cada requisicao so resolve o caminho pedido.
+_FRONTEND_DIST_ROOT = FRONTEND_DIST_DIR.resolve()
+_FRONTEND_DIST_PREFIX = f"{_FRONTEND_DIST_ROOT}{os.sep}"
+_FRONTEND_INDEX_FILE = _FRONTEND_DIST_ROOT / "index.html"
 
 
 def serve_frontend_file(path: str) -> FileResponse:
     """Serve um arquivo do build React; fallback para index.html (SPA)."""
-    index_file = FRONTEND_DIST_DIR / "index.html"
-    if not index_file.exists():
+    if not _FRONTEND_INDEX_FILE.exists():
         raise HTTPException(
             status_code=500,
             detail=(
@@ -513,16 +788,24 @@ def serve_frontend_file(path: str) -> FileResponse:
             ),
         )
 
-    target = (FRONTEND_DIST_DIR / path).resolve()
+    # index.html aponta para os assets com hash da versao atual: sempre revalidar.
+    index_response = FileResponse(str(_FRONTEND_INDEX_FILE), headers={"Cache-Control": "no-cache"})
+    try:
+        target = (_FRONTEND_DIST_ROOT / path).resolve(strict=True)
+        target_stat = target.stat()
+    except (OSError, RuntimeError):
+        return index_response
 
     # Bloqueia path traversal para fora da pasta dist
-    if FRONTEND_DIST_DIR.resolve() not in target.parents and target != FRONTEND_DIST_DIR.resolve():
-        return FileResponse(str(index_file))
+    target_path = str(target)
+    if not target_path.startswith(_FRONTEND_DIST_PREFIX) or target == _FRONTEND_INDEX_FILE:
+        return index_response
 
-    if target.is_file():
-        return FileResponse(str(target))
+    if stat.S_ISREG(target_stat.st_mode):
+        # O stat ja feito segue junto; o FileResponse nao repete a chamada.
+        return FileResponse(target_path, stat_result=target_stat)
 
-    return FileResponse(str(index_file))
+    return index_response
 
 
 @app.get("/api/me")
@@ -573,7 +856,7 @@ def update_my_password(
     if not user:
         raise HTTPException(status_code=404, detail="Usuario nao encontrado")
 
-    if not verify_password(payload.current_password, user["password_hash"]):
+    if not verify_password_cached(payload.current_password, user["password_hash"]):
         raise HTTPException(status_code=400, detail="Senha atual incorreta")
 
     new_password = payload.new_password.strip()
@@ -637,7 +920,7 @@ def update_role(
     if target_username == current_admin.username:
         raise HTTPException(status_code=400, detail="Nao e permitido alterar o proprio perfil")
 
-    user = get_user(target_username)
+    user, admin_total = get_user_with_admin_count(target_username)
     if not user:
         raise HTTPException(status_code=404, detail="Usuario nao encontrado")
 
@@ -646,7 +929,7 @@ def update_role(
     if current_role == new_role:
         return {"username": target_username, "role": new_role}
 
-    if current_role == "admin" and new_role == "user" and admin_count() <= 1:
+    if current_role == "admin" and new_role == "user" and admin_total <= 1:
         raise HTTPException(status_code=400, detail="Nao e permitido rebaixar o ultimo administrador")
 
     update_user_role(target_username, new_role)
@@ -664,17 +947,30 @@ def delete_user(username: str, current_admin: AuthUser = Depends(get_admin_user)
     if target_username == current_admin.username:
         raise HTTPException(status_code=400, detail="Nao e permitido remover o proprio usuario")
 
-    user = get_user(target_username)
+    user, admin_total = get_user_with_admin_count(target_username)
     if not user:
         raise HTTPException(status_code=404, detail="Usuario nao encontrado")
 
-    if user["role"] == "admin" and admin_count() <= 1:
+    if user["role"] == "admin" and admin_total <= 1:
         raise HTTPException(status_code=400, detail="Nao e permitido remover o ultimo administrador")
 
+    # A regra do ultimo administrador vale tambem dentro do proprio DELETE.
     with get_db_connection() as conn:
-        conn.execute("DELETE FROM users WHERE username = ?", (target_username,))
+        deleted = conn.execute(
+            """
+            DELETE FROM users
+            WHERE username = ?
+              AND (role <> 'admin' OR (SELECT COUNT(*) FROM users WHERE role = 'admin') > 1)
+            """,
+            (target_username,),
+        ).rowcount
         conn.commit()
 
+    if not deleted:
+        raise HTTPException(status_code=400, detail="Nao e permitido remover o ultimo administrador")
+
+    _invalidate_auth_enabled()
+
     return {"username": target_username}
 
 
@@ -699,26 +995,55 @@ def _iso_to_br_date(iso: str) -> str:
 
 def _build_sheet_row(headers: list[str], ev: EventWrite) -> list[str]:
     """Monta a lista de valores na ordem dos cabeçalhos da planilha."""
+    columns_by_key = resolve_columns(headers, _EVENT_COLUMN_ALIASES)
     field_map: dict[str, str] = {
-        find_column(headers, ["data"]) or "": _iso_to_br_date(ev.data),
-        find_column(headers, ["campanha", "assunto", "titulo", "title"]) or "": ev.campanha,
-        find_column(headers, ["canal", "channel"]) or "": ev.canal,
-        find_column(headers, ["direcionamento", "direcion", "target", "segmento"]) or "": ev.direcionamento,
-        find_column(headers, ["status", "situacao", "situação"]) or "": ev.status,
-        find_column(headers, ["produto", "product"]) or "": ev.produto,
-        find_column(headers, ["observacao", "obs", "observation"]) or "": ev.observacao,
+        columns_by_key["data"] or "": _iso_to_br_date(ev.data),
+        columns_by_key["campanha"] or "": ev.campanha,
+        columns_by_key["canal"] or "": ev.canal,
+        columns_by_key["direcionamento"] or "": ev.direcionamento,
+        columns_by_key["status"] or "": ev.status,
+        columns_by_key["produto"] or "": ev.produto,
+        columns_by_key["observacao"] or "": ev.observacao,
     }
     return [field_map.get(h, "") for h in headers]
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # Comparacao fraca (RFC 9110): o prefixo W/ e ignorado dos dois lados.
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates or "*" in candidates
+
+
 @app.get("/api/events")
-def get_events() -> dict[str, Any]:
-    dataframe = load_google_sheet()
-    if dataframe.empty:
-        return {"events": [], "total": 0, "source": "google_sheets"}
+async def get_events(request: Request) -> Any:
+    """Lista todas as campanhas da planilha."""
+    # gspread e sincrono: download e conversao rodam fora do event loop.
+    events, version = await asyncio.to_thread(load_events)
+
+    # no-cache: o navegador sempre revalida (edicoes aparecem na hora), mas recebe 304 sem corpo.
+    # ETag fraco: o GZipMiddleware entrega o mesmo validador nas versoes gzip e sem compressao.
+    etag = f'W/"{version}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    # Os eventos ja sao tipos JSON puros: resposta direta evita o jsonable_encoder item a item.
+    return ORJSONResponse(
+        {"events": events, "total": len(events), "source": "google_sheets"},
+        headers=cache_headers,
+    )
 
-    events = fetch_and_parse_csv_from_dataframe(dataframe)
-    return {"events": events, "total": len(events), "source": "google_sheets"}
+
+@app.post("/api/events/refresh")
+def refresh_events() -> dict[str, Any]:
+    """Forca a releitura da planilha (edicoes feitas direto no Google Sheets).
+
+    Aberto a qualquer usuario logado, como as demais rotas de eventos (o middleware exige login).
+    """
+    invalidate_sheet_cache()
+    return {"ok": True}
 
 
 @app.post("/api/events")
@@ -731,10 +1056,28 @@ def create_event(ev: EventWrite) -> dict[str, Any]:
     return {"ok": True, "row": new_row}
 
 
+def _ensure_row_unchanged(row: int, if_match: str | None) -> None:
+    """Confere a linha atual da planilha contra o _row_hash que o cliente viu.
+
+    O _row vem de uma leitura em cache; se alguem inseriu ou editou linhas direto na
+    planilha, o indice pode apontar para outra campanha.
+    """
+    if not if_match:
+        raise HTTPException(status_code=428, detail="Cabecalho If-Match ausente; recarregue o calendario")
+    expected = if_match.strip().removeprefix("W/").strip('"')
+    if _row_fingerprint(get_calendar_row(row)) != expected:
+        invalidate_sheet_cache()
+        raise HTTPException(
+            status_code=409,
+            detail="A campanha mudou na planilha desde o ultimo carregamento. Clique em Atualizar e tente de novo.",
+        )
+
+
 @app.put("/api/events/{row}")
-def update_event(row: int, ev: EventWrite) -> dict[str, Any]:
+def update_event(row: int, ev: EventWrite, if_match: str | None = Header(default=None)) -> dict[str, Any]:
     if row < 2:
         raise HTTPException(status_code=400, detail="Indice de linha invalido")
+    _ensure_row_unchanged(row, if_match)
     headers = get_sheet_headers()
     if not headers:
         raise HTTPException(status_code=500, detail="Nao foi possivel ler os cabecalhos da planilha")
@@ -744,9 +1087,10 @@ def update_event(row: int, ev: EventWrite) -> dict[str, Any]:
 
 
 @app.delete("/api/events/{row}")
-def delete_event(row: int) -> dict[str, Any]:
+def delete_event(row: int, if_match: str | None = Header(default=None)) -> dict[str, Any]:
     if row < 2:
         raise HTTPException(status_code=400, detail="Indice de linha invalido")
+    _ensure_row_unchanged(row, if_match)
     delete_calendar_row(row)
     return {"ok": True, "row": row}
 
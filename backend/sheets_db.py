@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 import os
+import random
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import gspread
 from google.oauth2.service_account import Credentials
-from gspread.utils import rowcol_to_a1
+from gspread.exceptions import APIError
+from gspread.utils import a1_to_rowcol, rowcol_to_a1
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout as RequestsTimeout
 
 PROJECT_HEADERS = [
     "id",
@@ -43,10 +49,45 @@ _SPREADSHEET_NAME = "crm_database"
 _TIMEOUT_SECONDS = 8
 _CACHE_TTL_SECONDS = 30
 
+# Column letters of both tabs ("A".."K"), resolved once instead of on every range built.
+_COLUMN_LETTERS = tuple(
+    rowcol_to_a1(1, col)[:-1] for col in range(1, max(len(PROJECT_HEADERS), len(TASK_HEADERS)) + 1)
+)
+
+
+class _CacheEntry(NamedTuple):
+    """Immutable snapshot of one tab; readers share it without copying and must not mutate it."""
+
+    loaded_at: float
+    items: tuple[dict[str, Any], ...]
+    by_id: dict[int, dict[str, Any]]
+    by_project: dict[int, tuple[dict[str, Any], ...]]
+    rows: dict[int, int]
+
+
+def _cache_entry(
+    loaded_at: float, items: Iterable[dict[str, Any]], rows: dict[int, int] | None = None
+) -> _CacheEntry:
+    """Wrap a record list together with its id and project_id lookup tables.
+
+    ``rows`` maps record ids to their last known 1-based sheet row; mutations verify it before use.
+    """
+    items = tuple(items)
+    by_id: dict[int, dict[str, Any]] = {}
+    by_project: dict[int, list[dict[str, Any]]] = {}
+    for item in items:
+        by_id[item["id"]] = item
+        if "project_id" in item:
+            by_project.setdefault(item["project_id"], []).append(item)
+    return _CacheEntry(
+        loaded_at, items, by_id, {project_id: tuple(tasks) for project_id, tasks in by_project.items()}, rows or {}
+    )
+
+
 _cache_lock = threading.Lock()
-_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {
-    "projects": (0.0, []),
-    "tasks": (0.0, []),
+_cache: dict[str, _CacheEntry] = {
+    "projects": _cache_entry(0.0, []),
+    "tasks": _cache_entry(0.0, []),
 }
 
 
@@ -58,13 +99,55 @@ class SheetsDBTimeoutError(SheetsDBError):
     """Google Sheets operation timed out."""
 
 
-def _run_with_timeout(func, *args, timeout: int = _TIMEOUT_SECONDS, **kwargs):
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(func, *args, **kwargs)
+def _translate_errors(func, *args, **kwargs):
+    """Run one gspread call, mapping HTTP timeouts to SheetsDBTimeoutError.
+
+    The timeout itself is set on the client in _build_client. Auth and not-found errors also
+    drop the cached handles.
+    """
+    try:
+        return func(*args, **kwargs)
+    except RequestsTimeout as exc:
+        raise SheetsDBTimeoutError("Operacao com Google Sheets excedeu o tempo limite") from exc
+    except APIError as exc:
+        # Revoked access or a removed spreadsheet/tab: the cached handles are no longer valid.
+        if exc.response.status_code in (401, 403, 404):
+            _reset_handles()
+        raise
+
+
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 4
+_MAX_RETRY_DELAY_SECONDS = 8.0
+
+
+def _call_api(func, *args, idempotent: bool = True, **kwargs):
+    """Run a gspread call with exponential backoff (full jitter) on rate limits and transient errors.
+
+    Appends and row deletes are not idempotent, so they are only retried on 429, which Google
+    rejects before applying anything. Retries share one _TIMEOUT_SECONDS budget: once the next
+    backoff would overrun it, the call fails with SheetsDBTimeoutError instead of sleeping.
+    """
+    deadline = time.monotonic() + _TIMEOUT_SECONDS
+    for attempt in range(_MAX_RETRIES + 1):
         try:
-            return future.result(timeout=timeout)
-        except FuturesTimeoutError as exc:
-            raise SheetsDBTimeoutError("Operacao com Google Sheets excedeu o tempo limite") from exc
+            return _translate_errors(func, *args, **kwargs)
+        except APIError as exc:
+            status_code = exc.response.status_code
+            retryable = status_code == 429 or (idempotent and status_code in _RETRY_STATUS_CODES)
+            if not retryable or attempt == _MAX_RETRIES:
+                raise
+            delay = _retry_delay(exc, attempt)
+            if time.monotonic() + delay >= deadline:
+                raise SheetsDBTimeoutError("Operacao com Google Sheets excedeu o tempo limite") from exc
+            time.sleep(delay)
+
+
+def _retry_delay(exc: APIError, attempt: int) -> float:
+    retry_after = exc.response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_DELAY_SECONDS)
+    return random.uniform(0, min(_MAX_RETRY_DELAY_SECONDS, 0.5 * 2**attempt))
 
 
 def _coerce_optional(value: str | None) -> str | None:
@@ -83,24 +166,75 @@ def _iso_now() -> str:
     return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
 
-def _get_cached(key: str) -> list[dict[str, Any]] | None:
+def _get_cached(key: str) -> _CacheEntry | None:
     now = time.time()
     with _cache_lock:
-        ts, data = _cache[key]
-        if now - ts < _CACHE_TTL_SECONDS:
-            return [item.copy() for item in data]
+        entry = _cache[key]
+    if now - entry.loaded_at < _CACHE_TTL_SECONDS:
+        return entry
     return None
 
 
-def _set_cache(key: str, data: list[dict[str, Any]]) -> None:
+def _set_cache(key: str, data: list[dict[str, Any]], rows: dict[int, int] | None = None) -> _CacheEntry:
+    # Published by swapping the reference; the records themselves are never modified afterwards.
+    entry = _cache_entry(time.time(), data, rows)
     with _cache_lock:
-        _cache[key] = (time.time(), [item.copy() for item in data])
+        _cache[key] = entry
+    return entry
 
 
 def _invalidate_cache(*keys: str) -> None:
     with _cache_lock:
         for key in keys:
-            _cache[key] = (0.0, [])
+            _cache[key] = _cache_entry(0.0, [])
+
+
+def _creation_order(item: dict[str, Any]) -> tuple[str, int]:
+    return item["created_at"], item["id"]
+
+
+def _cache_upsert(key: str, *new_items: dict[str, Any], first_row: int | None = None) -> None:
+    """Put freshly written records into a warm cache instead of forcing a full re-read.
+
+    The load timestamp is kept, so edits made directly in the sheet still show up after the TTL.
+    ``first_row`` is the sheet row of the first appended record, when the records were just appended.
+    """
+    with _cache_lock:
+        entry = _cache[key]
+        if time.time() - entry.loaded_at >= _CACHE_TTL_SECONDS:
+            return
+        new_ids = {item["id"] for item in new_items}
+        items = [current for current in entry.items if current["id"] not in new_ids]
+        items.extend(item.copy() for item in new_items)
+        items.sort(key=_creation_order)
+        rows = entry.rows
+        if first_row is not None:
+            rows = {**rows, **{item["id"]: first_row + offset for offset, item in enumerate(new_items)}}
+        _cache[key] = _cache_entry(entry.loaded_at, items, rows)
+
+
+def _cache_remove(key: str, field: str, value: Any, deleted_rows: Iterable[int] = ()) -> None:
+    """Drop cached records whose ``field`` equals ``value``; rows below ``deleted_rows`` shift up."""
+    deleted = sorted(deleted_rows)
+    with _cache_lock:
+        entry = _cache[key]
+        items = [item for item in entry.items if item[field] != value]
+        rows = {}
+        for item in items:
+            row_idx = entry.rows.get(item["id"])
+            if row_idx is not None:
+                rows[item["id"]] = row_idx - bisect.bisect_left(deleted, row_idx)
+        _cache[key] = _cache_entry(entry.loaded_at, items, rows)
+
+
+@contextmanager
+def _invalidate_on_error(*keys: str) -> Iterator[None]:
+    # A failed or timed-out write may still have reached the sheet: re-read on next access.
+    try:
+        yield
+    except Exception:
+        _invalidate_cache(*keys)
+        raise
 
 
 def _build_client() -> gspread.Client:
@@ -120,37 +254,78 @@ def _build_client() -> gspread.Client:
 
     try:
         credentials = Credentials.from_service_account_info(service_account_info, scopes=scopes)
-        return gspread.authorize(credentials)
+        client = gspread.authorize(credentials)
+        # gspread's own session, with a larger pool: requests keeps only 10 connections per host by
+        # default, and concurrent threadpool handlers beyond that would each pay a new TLS handshake.
+        client.http_client.session.mount("https://", HTTPAdapter(pool_maxsize=16))
+        # Connect/read timeout applied by gspread to every request it sends.
+        client.set_timeout(_TIMEOUT_SECONDS)
+        return client
     except Exception as exc:  # pragma: no cover - network/auth integration
         raise SheetsDBError("Falha ao autenticar no Google Sheets") from exc
 
 
+# Authorized client, spreadsheet and worksheet handles, reused across calls. The client's
+# credentials refresh their own access token, so nothing here needs a TTL.
+_handles_lock = threading.RLock()
+_client: gspread.Client | None = None
+_spreadsheet: gspread.Spreadsheet | None = None
+_worksheets: dict[tuple[str, str], gspread.Worksheet] = {}
+
+
+def _reset_handles() -> None:
+    global _client, _spreadsheet
+    with _handles_lock:
+        _client = None
+        _spreadsheet = None
+        _worksheets.clear()
+
+
+def _get_client() -> gspread.Client:
+    global _client
+    with _handles_lock:
+        if _client is None:
+            _client = _build_client()
+        return _client
+
+
 def _open_spreadsheet() -> gspread.Spreadsheet:
-    client = _build_client()
-    try:
-        return _run_with_timeout(client.open, _SPREADSHEET_NAME)
-    except SheetsDBTimeoutError:
-        raise
-    except Exception as exc:  # pragma: no cover - network integration
-        raise SheetsDBError(f"Planilha '{_SPREADSHEET_NAME}' nao encontrada ou inacessivel") from exc
+    global _spreadsheet
+    with _handles_lock:
+        if _spreadsheet is not None:
+            return _spreadsheet
+        client = _get_client()
+        try:
+            _spreadsheet = _call_api(client.open, _SPREADSHEET_NAME)
+        except SheetsDBTimeoutError:
+            raise
+        except Exception as exc:  # pragma: no cover - network integration
+            raise SheetsDBError(f"Planilha '{_SPREADSHEET_NAME}' nao encontrada ou inacessivel") from exc
+        return _spreadsheet
 
 
 def _ensure_worksheet(spreadsheet: gspread.Spreadsheet, title: str, headers: list[str]) -> gspread.Worksheet:
+    """Open (or create) a tab and make sure its header row is in place; done once per process."""
+    key = (spreadsheet.id, title)
+    worksheet = _worksheets.get(key)
+    if worksheet is not None:
+        return worksheet
+
     try:
-        worksheet = _run_with_timeout(spreadsheet.worksheet, title)
+        worksheet = _call_api(spreadsheet.worksheet, title)
     except SheetsDBTimeoutError:
         raise
     except Exception:
-        worksheet = _run_with_timeout(spreadsheet.add_worksheet, title=title, rows=2000, cols=max(20, len(headers)))
+        worksheet = _call_api(
+            spreadsheet.add_worksheet, title=title, rows=2000, cols=max(20, len(headers)), idempotent=False
+        )
 
-    values = _run_with_timeout(worksheet.get_all_values)
-    if not values:
-        _run_with_timeout(worksheet.update, "A1", [headers])
-    else:
-        first_row = [cell.strip() for cell in values[0]]
-        if first_row[: len(headers)] != headers:
-            _run_with_timeout(worksheet.update, "A1", [headers])
+    # Only the header row is needed here, not the whole tab.
+    first_row = [cell.strip() for cell in _call_api(worksheet.row_values, 1)]
+    if first_row[: len(headers)] != headers:
+        _call_api(worksheet.update, "A1", [headers])
 
+    _worksheets[key] = worksheet
     return worksheet
 
 
@@ -162,28 +337,95 @@ def _as_row(row: dict[str, Any], headers: list[str]) -> list[str]:
     return result
 
 
-def _read_records(worksheet: gspread.Worksheet, headers: list[str]) -> list[dict[str, str]]:
-    values = _run_with_timeout(worksheet.get_all_values)
-    if not values:
-        return []
+def _changed_cells(
+    row_idx: int, headers: list[str], before: dict[str, Any], after: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """batch_update entries for the cells of one sheet row whose value actually changed."""
+    return [
+        {"range": f"{_COLUMN_LETTERS[col]}{row_idx}", "values": [[new_value]]}
+        for col, (old_value, new_value) in enumerate(zip(_as_row(before, headers), _as_row(after, headers)))
+        if old_value != new_value
+    ]
+
 
-    records: list[dict[str, str]] = []
-    for row in values[1:]:
-        normalized = row + [""] * max(0, len(headers) - len(row))
-        records.append({headers[idx]: normalized[idx] for idx in range(len(headers))})
-    return records
+def _delete_rows_requests(sheet_id: int, rows: list[int]) -> list[dict[str, Any]]:
+    """deleteDimension requests for 1-based sheet rows, bottom-up and merged into contiguous spans."""
+    spans: list[list[int]] = []
+    for row in sorted(set(rows), reverse=True):
+        if spans and spans[-1][0] == row + 1:
+            spans[-1][0] = row
+        else:
+            spans.append([row, row])
+    return [
+        {
+            "deleteDimension": {
+                "range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": start - 1, "endIndex": end}
+            }
+        }
+        for start, end in spans
+    ]
 
 
-def _read_records_with_index(worksheet: gspread.Worksheet, headers: list[str]) -> list[tuple[int, dict[str, str]]]:
-    values = _run_with_timeout(worksheet.get_all_values)
-    if not values:
-        return []
+def _data_range(title: str, headers: list[str]) -> str:
+    """A1 range of a tab's data rows (row 2 onward), limited to the known header columns."""
+    return f"{title}!A2:{_COLUMN_LETTERS[len(headers) - 1]}"
+
+
+def _values_get(spreadsheet: gspread.Spreadsheet, title: str, headers: list[str]) -> list[list[str]]:
+    response = _call_api(spreadsheet.values_get, _data_range(title, headers))
+    return response.get("values", [])
+
+
+def _rows_to_records(rows: list[list[str]], headers: list[str]) -> list[dict[str, str]]:
+    width = len(headers)
+    # The API drops trailing empty cells, so short rows are padded before zipping.
+    return [dict(zip(headers, row if len(row) >= width else row + [""] * (width - len(row)))) for row in rows]
+
+
+def _appended_row(response: dict[str, Any]) -> int | None:
+    """First sheet row written by an append call, parsed from its ``updatedRange``."""
+    updated_range = (response or {}).get("updates", {}).get("updatedRange")
+    if not updated_range:
+        return None
+    return a1_to_rowcol(updated_range.rsplit("!", 1)[-1].split(":", 1)[0])[0]
+
+
+def _cached_row(title: str, record_id: int) -> int | None:
+    cached = _get_cached(title)
+    return cached.rows.get(record_id) if cached is not None else None
+
 
-    records: list[tuple[int, dict[str, str]]] = []
-    for sheet_row_idx, row in enumerate(values[1:], start=2):
-        normalized = row + [""] * max(0, len(headers) - len(row))
-        records.append((sheet_row_idx, {headers[idx]: normalized[idx] for idx in range(len(headers))}))
-    return records
+def _row_range(title: str, headers: list[str], row_idx: int) -> str:
+    return f"{title}!A{row_idx}:{_COLUMN_LETTERS[len(headers) - 1]}{row_idx}"
+
+
+def _match_row(
+    rows: list[list[str]], headers: list[str], record_id: int, first_row: int = 2
+) -> tuple[int, dict[str, str]] | None:
+    # Match on the raw id cell; only the matching row becomes a record.
+    id_col = headers.index("id")
+    for row_idx, row in enumerate(rows, start=first_row):
+        if len(row) > id_col and _coerce_int(row[id_col], 0) == record_id:
+            return row_idx, _rows_to_records([row], headers)[0]
+    return None
+
+
+def _find_row(
+    spreadsheet: gspread.Spreadsheet, title: str, headers: list[str], record_id: int
+) -> tuple[int, dict[str, str]] | None:
+    """Sheet row and raw record for ``record_id``.
+
+    A warm cache supplies the row number and only that row is fetched; if its id cell no longer
+    matches (rows inserted or removed by hand), the whole tab is scanned instead.
+    """
+    row_idx = _cached_row(title, record_id)
+    if row_idx is not None:
+        response = _call_api(spreadsheet.values_get, _row_range(title, headers, row_idx))
+        found = _match_row(response.get("values", []), headers, record_id, row_idx)
+        if found is not None:
+            return found
+        _invalidate_cache(title)
+    return _match_row(_values_get(spreadsheet, title, headers), headers, record_id)
 
 
 def _normalize_project(raw: dict[str, str]) -> dict[str, Any]:
@@ -215,49 +457,85 @@ def _normalize_task(raw: dict[str, str]) -> dict[str, Any]:
     }
 
 
-def _next_id(records: list[dict[str, Any]]) -> int:
+def _next_id(records: Sequence[dict[str, Any]]) -> int:
     if not records:
         return 1
     return max(int(item.get("id") or 0) for item in records) + 1
 
 
-def _load_projects() -> list[dict[str, Any]]:
+def _load_projects() -> tuple[dict[str, Any], ...]:
+    return _projects_entry().items
+
+
+def _load_tasks() -> tuple[dict[str, Any], ...]:
+    return _tasks_entry().items
+
+
+def _projects_entry() -> _CacheEntry:
     cached = _get_cached("projects")
     if cached is not None:
         return cached
-
-    spreadsheet = _open_spreadsheet()
-    worksheet = _ensure_worksheet(spreadsheet, "projects", PROJECT_HEADERS)
-    records = _read_records(worksheet, PROJECT_HEADERS)
-    projects = [_normalize_project(item) for item in records if _coerce_int(item.get("id"), 0) > 0]
-    projects.sort(key=lambda item: item["id"])
-    _set_cache("projects", projects)
-    return projects
+    return _prime_cache()[0]
 
 
-def _load_tasks() -> list[dict[str, Any]]:
+def _tasks_entry() -> _CacheEntry:
     cached = _get_cached("tasks")
     if cached is not None:
         return cached
-
-    spreadsheet = _open_spreadsheet()
-    worksheet = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
-    records = _read_records(worksheet, TASK_HEADERS)
-    tasks = [_normalize_task(item) for item in records if _coerce_int(item.get("id"), 0) > 0]
-    tasks.sort(key=lambda item: item["id"])
-    _set_cache("tasks", tasks)
-    return tasks
-
-
-def get_projects() -> list[dict[str, Any]]:
+    return _prime_cache()[1]
+
+
+_prime_lock = threading.Lock()
+
+
+def _prime_cache() -> tuple[_CacheEntry, _CacheEntry]:
+    """Load both tabs with one batchGet; pages that show a project with its tasks need both.
+
+    Concurrent callers wait for the request already in flight instead of issuing their own.
+    """
+    with _prime_lock:
+        projects_cached = _get_cached("projects")
+        tasks_cached = _get_cached("tasks")
+        if projects_cached is not None and tasks_cached is not None:
+            return projects_cached, tasks_cached
+
+        spreadsheet = _open_spreadsheet()
+        _ensure_worksheet(spreadsheet, "projects", PROJECT_HEADERS)
+        _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
+        response = _call_api(
+            spreadsheet.values_batch_get,
+            [_data_range("projects", PROJECT_HEADERS), _data_range("tasks", TASK_HEADERS)],
+        )
+        project_range, task_range = response.get("valueRanges", [{}, {}])
+
+        project_rows: dict[int, int] = {}
+        projects = []
+        for row_idx, raw in enumerate(_rows_to_records(project_range.get("values", []), PROJECT_HEADERS), start=2):
+            if _coerce_int(raw.get("id"), 0) > 0:
+                item = _normalize_project(raw)
+                project_rows[item["id"]] = row_idx
+                projects.append(item)
+        # Kept in creation order so list endpoints don't have to sort per request.
+        projects.sort(key=_creation_order)
+
+        task_rows: dict[int, int] = {}
+        tasks = []
+        for row_idx, raw in enumerate(_rows_to_records(task_range.get("values", []), TASK_HEADERS), start=2):
+            if _coerce_int(raw.get("id"), 0) > 0:
+                item = _normalize_task(raw)
+                task_rows[item["id"]] = row_idx
+                tasks.append(item)
+        tasks.sort(key=_creation_order)
+
+        return _set_cache("projects", projects, project_rows), _set_cache("tasks", tasks, task_rows)
+
+
+def get_projects() -> tuple[dict[str, Any], ...]:
     return _load_projects()
 
 
 def get_project(project_id: int) -> dict[str, Any] | None:
-    for project in _load_projects():
-        if project["id"] == project_id:
-            return project
-    return None
+    return _projects_entry().by_id.get(project_id)
 
 
 def create_project(payload: dict[str, Any]) -> dict[str, Any]:
@@ -275,44 +553,37 @@ def create_project(payload: dict[str, Any]) -> dict[str, Any]:
 
     spreadsheet = _open_spreadsheet()
     worksheet = _ensure_worksheet(spreadsheet, "projects", PROJECT_HEADERS)
-    _run_with_timeout(worksheet.append_row, _as_row(new_item, PROJECT_HEADERS), value_input_option="USER_ENTERED")
+    with _invalidate_on_error("projects"):
+        response = _call_api(
+            worksheet.append_row, _as_row(new_item, PROJECT_HEADERS), value_input_option="USER_ENTERED", idempotent=False
+        )
 
-    _invalidate_cache("projects")
+    _cache_upsert("projects", new_item, first_row=_appended_row(response))
     return new_item
 
 
 def update_project(project_id: int, update_data: dict[str, Any]) -> dict[str, Any] | None:
     spreadsheet = _open_spreadsheet()
     worksheet = _ensure_worksheet(spreadsheet, "projects", PROJECT_HEADERS)
-    indexed = _read_records_with_index(worksheet, PROJECT_HEADERS)
-
-    target_row_idx: int | None = None
-    target_item: dict[str, Any] | None = None
-
-    for row_idx, raw in indexed:
-        item = _normalize_project(raw)
-        if item["id"] == project_id:
-            target_row_idx = row_idx
-            target_item = item
-            break
-
-    if target_row_idx is None or target_item is None:
+    found = _find_row(spreadsheet, "projects", PROJECT_HEADERS, project_id)
+    if found is None:
         return None
 
+    target_row_idx, raw = found
+    target_item = _normalize_project(raw)
+
+    current_item = dict(target_item)
     for key, value in update_data.items():
         target_item[key] = value
 
     target_item["id"] = project_id
 
-    end_col = rowcol_to_a1(target_row_idx, len(PROJECT_HEADERS))
-    _run_with_timeout(
-        worksheet.update,
-        f"A{target_row_idx}:{end_col}",
-        [_as_row(target_item, PROJECT_HEADERS)],
-        value_input_option="USER_ENTERED",
-    )
-
-    _invalidate_cache("projects")
+    # Only the cells that changed go to Sheets, all in a single request.
+    changed = _changed_cells(target_row_idx, PROJECT_HEADERS, current_item, target_item)
+    if changed:
+        with _invalidate_on_error("projects"):
+            _call_api(worksheet.batch_update, changed, value_input_option="USER_ENTERED")
+        _cache_upsert("projects", target_item)
     return target_item
 
 
@@ -321,43 +592,62 @@ def delete_project(project_id: int) -> bool:
     projects_ws = _ensure_worksheet(spreadsheet, "projects", PROJECT_HEADERS)
     tasks_ws = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
 
-    projects_indexed = _read_records_with_index(projects_ws, PROJECT_HEADERS)
-    project_row_idx: int | None = None
-    for row_idx, raw in projects_indexed:
-        if _normalize_project(raw)["id"] == project_id:
-            project_row_idx = row_idx
-            break
-
-    if project_row_idx is None:
+    # The project row (or the whole tab on a cold cache) and the task tab come back in one batchGet.
+    # Every task row of the project must go, so the task tab is always read fresh.
+    cached_row_idx = _cached_row("projects", project_id)
+    project_range = (
+        _row_range("projects", PROJECT_HEADERS, cached_row_idx)
+        if cached_row_idx is not None
+        else _data_range("projects", PROJECT_HEADERS)
+    )
+    response = _call_api(spreadsheet.values_batch_get, [project_range, _data_range("tasks", TASK_HEADERS)])
+    project_range_values, task_range_values = response.get("valueRanges", [{}, {}])
+    project_values = project_range_values.get("values", [])
+    task_values = task_range_values.get("values", [])
+
+    found = _match_row(project_values, PROJECT_HEADERS, project_id, cached_row_idx or 2)
+    if found is None and cached_row_idx is not None:
+        # Stale cached row: scan the tab directly instead of re-fetching the same row.
+        _invalidate_cache("projects")
+        found = _match_row(_values_get(spreadsheet, "projects", PROJECT_HEADERS), PROJECT_HEADERS, project_id)
+    if found is None:
         return False
 
-    _run_with_timeout(projects_ws.delete_rows, project_row_idx)
+    project_row_idx = found[0]
+    project_col = TASK_HEADERS.index("project_id")
+    rows_to_delete = [
+        row_idx
+        for row_idx, row in enumerate(task_values, start=2)
+        if len(row) > project_col and _coerce_int(row[project_col], 0) == project_id
+    ]
 
-    tasks_indexed = _read_records_with_index(tasks_ws, TASK_HEADERS)
-    rows_to_delete = [row_idx for row_idx, raw in tasks_indexed if _normalize_task(raw)["project_id"] == project_id]
-    for row_idx in sorted(rows_to_delete, reverse=True):
-        _run_with_timeout(tasks_ws.delete_rows, row_idx)
+    # Project row and all of its task rows go away in a single batchUpdate round-trip.
+    requests = _delete_rows_requests(projects_ws.id, [project_row_idx])
+    requests += _delete_rows_requests(tasks_ws.id, rows_to_delete)
+    with _invalidate_on_error("projects", "tasks"):
+        _call_api(spreadsheet.batch_update, {"requests": requests}, idempotent=False)
 
-    _invalidate_cache("projects", "tasks")
+    _cache_remove("projects", "id", project_id, [project_row_idx])
+    _cache_remove("tasks", "project_id", project_id, rows_to_delete)
     return True
 
 
-def get_tasks(project_id: int) -> list[dict[str, Any]]:
-    tasks = _load_tasks()
-    return [task for task in tasks if task["project_id"] == project_id]
+def get_tasks(project_id: int) -> tuple[dict[str, Any], ...]:
+    return _tasks_entry().by_project.get(project_id, ())
+
+
+def get_tasks_by_id() -> dict[int, dict[str, Any]]:
+    """All tasks keyed by id, from a single (cached) sheet read. Shared snapshot: do not mutate."""
+    return _tasks_entry().by_id
 
 
 def get_task(task_id: int) -> dict[str, Any] | None:
-    for task in _load_tasks():
-        if task["id"] == task_id:
-            return task
-    return None
+    return _tasks_entry().by_id.get(task_id)
 
 
-def create_task(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-    tasks = _load_tasks()
-    new_item = {
-        "id": _next_id(tasks),
+def _new_task(task_id: int, project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": task_id,
         "project_id": project_id,
         "depends_on_task_id": payload.get("depends_on_task_id"),
         "title": payload["title"],
@@ -370,32 +660,54 @@ def create_task(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
         "created_at": _iso_now(),
     }
 
+
+def create_task(project_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    new_item = _new_task(_next_id(_load_tasks()), project_id, payload)
+
     spreadsheet = _open_spreadsheet()
     worksheet = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
-    _run_with_timeout(worksheet.append_row, _as_row(new_item, TASK_HEADERS), value_input_option="USER_ENTERED")
+    with _invalidate_on_error("tasks"):
+        response = _call_api(
+            worksheet.append_row, _as_row(new_item, TASK_HEADERS), value_input_option="USER_ENTERED", idempotent=False
+        )
 
-    _invalidate_cache("tasks")
+    _cache_upsert("tasks", new_item, first_row=_appended_row(response))
     return new_item
 
 
-def update_task(task_id: int, update_data: dict[str, Any]) -> dict[str, Any] | None:
+def bulk_create_tasks(project_id: int, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Create several tasks of one project with a single append_rows call."""
+    if not payloads:
+        return []
+
+    first_id = _next_id(_load_tasks())
+    new_items = [_new_task(first_id + offset, project_id, payload) for offset, payload in enumerate(payloads)]
+
     spreadsheet = _open_spreadsheet()
     worksheet = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
-    indexed = _read_records_with_index(worksheet, TASK_HEADERS)
+    with _invalidate_on_error("tasks"):
+        response = _call_api(
+            worksheet.append_rows,
+            [_as_row(item, TASK_HEADERS) for item in new_items],
+            value_input_option="USER_ENTERED",
+            idempotent=False,
+        )
 
-    target_row_idx: int | None = None
-    target_item: dict[str, Any] | None = None
+    _cache_upsert("tasks", *new_items, first_row=_appended_row(response))
+    return new_items
 
-    for row_idx, raw in indexed:
-        item = _normalize_task(raw)
-        if item["id"] == task_id:
-            target_row_idx = row_idx
-            target_item = item
-            break
 
-    if target_row_idx is None or target_item is None:
+def update_task(task_id: int, update_data: dict[str, Any]) -> dict[str, Any] | None:
+    spreadsheet = _open_spreadsheet()
+    worksheet = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
+    found = _find_row(spreadsheet, "tasks", TASK_HEADERS, task_id)
+    if found is None:
         return None
 
+    target_row_idx, raw = found
+    target_item = _normalize_task(raw)
+
+    current_item = dict(target_item)
     for key, value in update_data.items():
         if key == "project_id":
             continue
@@ -403,32 +715,24 @@ def update_task(task_id: int, update_data: dict[str, Any]) -> dict[str, Any] | N
 
     target_item["id"] = task_id
 
-    end_col = rowcol_to_a1(target_row_idx, len(TASK_HEADERS))
-    _run_with_timeout(
-        worksheet.update,
-        f"A{target_row_idx}:{end_col}",
-        [_as_row(target_item, TASK_HEADERS)],
-        value_input_option="USER_ENTERED",
-    )
-
-    _invalidate_cache("tasks")
+    # Only the cells that changed go to Sheets, all in a single request.
+    changed = _changed_cells(target_row_idx, TASK_HEADERS, current_item, target_item)
+    if changed:
+        with _invalidate_on_error("tasks"):
+            _call_api(worksheet.batch_update, changed, value_input_option="USER_ENTERED")
+        _cache_upsert("tasks", target_item)
     return target_item
 
 
 def delete_task(task_id: int) -> bool:
     spreadsheet = _open_spreadsheet()
     worksheet = _ensure_worksheet(spreadsheet, "tasks", TASK_HEADERS)
-    indexed = _read_records_with_index(worksheet, TASK_HEADERS)
-
-    target_row_idx: int | None = None
-    for row_idx, raw in indexed:
-        if _normalize_task(raw)["id"] == task_id:
-            target_row_idx = row_idx
-            break
-
-    if target_row_idx is None:
+    found = _find_row(spreadsheet, "tasks", TASK_HEADERS, task_id)
+    if found is None:
         return False
 
-    _run_with_timeout(worksheet.delete_rows, target_row_idx)
-    _invalidate_cache("tasks")
+    target_row_idx = found[0]
+    with _invalidate_on_error("tasks"):
+        _call_api(worksheet.delete_rows, target_row_idx, idempotent=False)
+    _cache_remove("tasks", "id", task_id, [target_row_idx])
     return True
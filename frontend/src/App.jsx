@@ -1,4 +1,4 @@
-import { Fragment, useCallback, useEffect, useMemo, useState } from 'react'
+import { Fragment, useCallback, useEffect, useMemo, useRef, useState } from 'react'
 import FullCalendar from '@fullcalendar/react'
 import dayGridPlugin from '@fullcalendar/daygrid'
 import interactionPlugin from '@fullcalendar/interaction'
@@ -44,6 +44,54 @@ function StatusIcon({ status, size = 11 }) {
   return <svg {...props}><circle cx="12" cy="12" r="4"/></svg>
 }
 
+// Opcoes fixas do calendario fora do componente: referencias estaveis evitam que o
+// FullCalendar reaplique toolbar/plugins e redesenhe todos os eventos a cada render.
+const CALENDAR_PLUGINS = [dayGridPlugin, interactionPlugin]
+const CALENDAR_BUTTON_TEXT = {
+  today: 'Hoje',
+  month: 'Mes',
+  week: 'Semana'
+}
+const CALENDAR_HEADER_TOOLBAR = {
+  left: 'prev,next today',
+  center: 'title',
+  right: 'dayGridMonth,dayGridWeek'
+}
+
+function renderCalendarEvent(info) {
+  const key = info.event.extendedProps?.channelKey || 'other'
+  const status = info.event.extendedProps?.status || ''
+  const soft = CHANNEL_SOFT[key] || CHANNEL_SOFT.other
+  const iconColor = STATUS_ICON_COLOR[status] ?? soft.text
+  return (
+    <div
+      title={`${info.event.title} · ${status}`}
+      style={{
+        background: soft.bg,
+        color: soft.text,
+        border: `1px solid ${soft.border}`,
+        borderRadius: '5px',
+        padding: '1px 5px',
+        display: 'flex',
+        alignItems: 'center',
+        gap: '4px',
+        fontSize: '11px',
+        fontWeight: 600,
+        width: '100%',
+        overflow: 'hidden',
+        cursor: 'pointer',
+      }}
+    >
+      <span style={{ color: iconColor, display: 'flex', flexShrink: 0 }}>
+        <StatusIcon status={status} />
+      </span>
+      <span style={{ overflow: 'hidden', textOverflow: 'ellipsis', whiteSpace: 'nowrap' }}>
+        {soft.label}
+      </span>
+    </div>
+  )
+}
+
 const CAMPANHAS_MENU_ITEMS = [
   { key: 'calendar', label: 'Calendario CRM' },
   { key: 'utm', label: 'Gerador de Tags UTM' },
@@ -237,6 +285,7 @@ export default function App({ mode = 'campanhas' }) {
   const [activeView, setActiveView] = useState(mode === 'adm' ? 'open-data' : 'calendar')
   const [events, setEvents] = useState([])
   const [loading, setLoading] = useState(false)
+  const eventsLoadedRef = useRef(false)
   const [error, setError] = useState('')
   const [selectedChannel, setSelectedChannel] = useState('all')
   const [selectedEvent, setSelectedEvent] = useState(null)
@@ -387,6 +436,7 @@ export default function App({ mode = 'campanhas' }) {
       })
 
       setEvents(normalized)
+      eventsLoadedRef.current = true
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Erro inesperado ao buscar campanhas')
       setEvents([])
@@ -1043,6 +1093,7 @@ export default function App({ mode = 'campanhas' }) {
       produto: p.produto || '',
       observacao: p.observacao || '',
       _row: p._row,
+      _row_hash: p._row_hash,
     })
     setEventFormMode('edit')
     setEventFormError('')
@@ -1056,10 +1107,14 @@ export default function App({ mode = 'campanhas' }) {
     try {
       const body = { ...formData }
       delete body._row
+      delete body._row_hash
       const isEdit = eventFormMode === 'edit' && formData._row
       const url = isEdit ? `/api/events/${formData._row}` : '/api/events'
       const method = isEdit ? 'PUT' : 'POST'
-      const res = await fetch(url, { method, headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(body) })
+      const headers = { 'Content-Type': 'application/json' }
+      // O backend confere se a linha da planilha ainda e a mesma que o calendario mostrou.
+      if (isEdit) headers['If-Match'] = `"${formData._row_hash || ''}"`
+      const res = await fetch(url, { method, headers, body: JSON.stringify(body) })
       const payload = await res.json()
       if (!res.ok) throw new Error(payload?.detail || 'Erro ao salvar campanha.')
       setEventFormOpen(false)
@@ -1071,10 +1126,10 @@ export default function App({ mode = 'campanhas' }) {
     }
   }, [eventFormMode, loadEvents])
 
-  const handleDeleteEvent = useCallback(async (row) => {
+  const handleDeleteEvent = useCallback(async (row, rowHash) => {
     if (!window.confirm('Excluir esta campanha da planilha?')) return
     try {
-      const res = await fetch(`/api/events/${row}`, { method: 'DELETE' })
+      const res = await fetch(`/api/events/${row}`, { method: 'DELETE', headers: { 'If-Match': `"${rowHash || ''}"` } })
       if (!res.ok) { const p = await res.json(); throw new Error(p?.detail || 'Erro ao excluir.') }
       setSelectedEvent(null)
       loadEvents()
@@ -1083,11 +1138,17 @@ export default function App({ mode = 'campanhas' }) {
     }
   }, [loadEvents])
 
+  // A lista completa ja esta em memoria (o painel de briefings usa todas as datas);
+  // navegar entre meses so precisa buscar de novo se ainda nao carregou.
   const handleDatesSet = useCallback(() => {
-    loadEvents()
+    if (!eventsLoadedRef.current) loadEvents()
   }, [loadEvents])
 
-  const handleRefresh = useCallback(() => {
+  // Descarta o cache do servidor antes de reler, para trazer edicoes feitas direto na planilha.
+  const handleRefresh = useCallback(async () => {
+    try {
+      await fetch('/api/events/refresh', { method: 'POST' })
+    } catch (_) { /* segue com a leitura normal */ }
     loadEvents()
   }, [loadEvents])
 
@@ -1379,57 +1440,17 @@ export default function App({ mode = 'campanhas' }) {
           )}
 
           <FullCalendar
-            plugins={[dayGridPlugin, interactionPlugin]}
+            plugins={CALENDAR_PLUGINS}
             initialView="dayGridMonth"
             locale="pt-br"
-            buttonText={{
-              today: 'Hoje',
-              month: 'Mes',
-              week: 'Semana'
-            }}
-            headerToolbar={{
-              left: 'prev,next today',
-              center: 'title',
-              right: 'dayGridMonth,dayGridWeek'
-            }}
+            buttonText={CALENDAR_BUTTON_TEXT}
+            headerToolbar={CALENDAR_HEADER_TOOLBAR}
             events={filteredEvents}
             datesSet={handleDatesSet}
             eventClick={handleEventClick}
             height="auto"
             dayMaxEventRows={3}
-            eventContent={(info) => {
-              const key = info.event.extendedProps?.channelKey || 'other'
-              const status = info.event.extendedProps?.status || ''
-              const soft = CHANNEL_SOFT[key] || CHANNEL_SOFT.other
-              const iconColor = STATUS_ICON_COLOR[status] ?? soft.text
-              return (
-                <div
-                  title={`${info.event.title} · ${status}`}
-                  style={{
-                    background: soft.bg,
-                    color: soft.text,
-                    border: `1px solid ${soft.border}`,
-                    borderRadius: '5px',
-                    padding: '1px 5px',
-                    display: 'flex',
-                    alignItems: 'center',
-                    gap: '4px',
-                    fontSize: '11px',
-                    fontWeight: 600,
-                    width: '100%',
-                    overflow: 'hidden',
-                    cursor: 'pointer',
-                  }}
-                >
-                  <span style={{ color: iconColor, display: 'flex', flexShrink: 0 }}>
-                    <StatusIcon status={status} />
-                  </span>
-                  <span style={{ overflow: 'hidden', textOverflow: 'ellipsis', whiteSpace: 'nowrap' }}>
-                    {soft.label}
-                  </span>
-                </div>
-              )
-            }}
+            eventContent={renderCalendarEvent}
           />
         </div>
       </section>
@@ -3499,7 +3520,7 @@ export default function App({ mode = 'campanhas' }) {
                 </button>
                 <button
                   type="button"
-                  onClick={() => handleDeleteEvent(selectedEvent.extendedProps._row)}
+                  onClick={() => handleDeleteEvent(selectedEvent.extendedProps._row, selectedEvent.extendedProps._row_hash)}
                   className="rounded-lg border border-rose-200 px-4 py-2 text-sm font-semibold text-rose-600 transition hover:bg-rose-50"
                 >
                   Excluir
@@ -22,4 +22,7 @@ if [ ! -f "frontend/dist/index.html" ]; then
   cd ..
 fi
 
+# Um unico processo, de proposito: sheets_db gera ids de projetos/tarefas a partir do cache
+# em memoria do processo, entao dois workers poderiam entregar o mesmo id e gravar na linha errada.
+# O uvicorn escolhe uvloop/httptools automaticamente quando instalados.
 exec python3 -m uvicorn server:app --host 0.0.0.0 --port "$PORT"